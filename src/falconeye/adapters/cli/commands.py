@@ -1,6 +1,8 @@
 """CLI command implementations."""
 
 import asyncio
+import os
+import threading
 from pathlib import Path
 from typing import Optional
 from rich.console import Console
@@ -12,9 +14,47 @@ from ...infrastructure.config.config_loader import ConfigLoader
 from ...infrastructure.presentation.error_presenter import ErrorPresenter
 from ...application.commands.index_codebase import IndexCodebaseCommand
 from ...application.commands.review_file import ReviewFileCommand
+from ...domain.exceptions import EmbeddingMismatchError
 from ..formatters.formatter_factory import FormatterFactory
 
 
+async def _check_index_embeddings(container: DIContainer) -> None:
+    """
+    Verify that the indexed collections match the configured embeddings.
+
+    Args:
+        container: DI container
+
+    Raises:
+        EmbeddingMismatchError: If a collection needs to be re-indexed
+    """
+    for collection in ("code", "documents"):
+        await container.vector_store.check_embedding_compatibility(collection)
+
+
+def _write_report(formatter, review, target: Path) -> None:
+    """
+    Stream a formatted review into a file, replacing it atomically.
+
+    The report is written to a temporary file next to the target and only
+    moved into place once serialization succeeded, so a failure never
+    leaves a truncated report behind.
+
+    Args:
+        formatter: Output formatter
+        review: SecurityReview to write
+        target: Report file path
+    """
+    tmp_file = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_file.open("w", encoding="utf-8") as f:
+            formatter.write_review(review, f)
+        os.replace(tmp_file, target)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
 def index_command(
     path: Path,
     language: Optional[str],
@@ -26,6 +66,7 @@ def index_command(
     config_path: Optional[str],
     verbose: bool,
     console: Console,
+    container: Optional[DIContainer] = None,
 ):
     """
     Execute index command.
@@ -41,6 +82,7 @@ def index_command(
         config_path: Config file path
         verbose: Enable verbose output
         console: Rich console
+        container: Existing DI container to reuse (created if None)
     """
     console.print(Panel.fit(
         "[bold]FalconEYE Indexer[/bold]",
@@ -48,7 +90,8 @@ def index_command(
     ))
 
     # Create DI container
-    container = DIContainer.create(config_path)
+    if container is None:
+        container = DIContainer.create(config_path)
 
     # Use config values if not specified
     if chunk_size is None:
@@ -120,6 +163,7 @@ def review_command(
     config_path: Optional[str],
     verbose: bool,
     console: Console,
+    container: Optional[DIContainer] = None,
 ):
     """
     Execute review command.
@@ -135,6 +179,7 @@ def review_command(
         config_path: Config file path
         verbose: Verbose output
         console: Rich console
+        container: Existing DI container to reuse (created if None)
     """
     console.print(Panel.fit(
         "[bold]FalconEYE Security Review[/bold]",
@@ -142,7 +187,17 @@ def review_command(
     ))
 
     # Create DI container
-    container = DIContainer.create(config_path)
+    if container is None:
+        container = DIContainer.create(config_path)
+
+    # Fail before analysis if the index cannot be searched with the
+    # configured embeddings, rather than reviewing without RAG context
+    try:
+        asyncio.run(_check_index_embeddings(container))
+    except EmbeddingMismatchError as e:
+        error_msg = ErrorPresenter.present(e, verbose=verbose)
+        console.print(f"\n{error_msg}")
+        raise SystemExit(1)
 
     # Use config values if not specified
     if top_k is None:
@@ -180,6 +235,9 @@ def review_command(
             console.print(f"[yellow]No source files found in {path}[/yellow]")
             return
 
+        # Load the analysis model while the first file's context is built
+        threading.Thread(target=container.llm_service.preload_chat_model, daemon=True).start()
+
         # Create aggregate review
         from ...domain.models.security import SecurityReview
         aggregate_review = SecurityReview.create(
@@ -252,6 +310,9 @@ def review_command(
             top_k_context=top_k,
         )
 
+        # Load the analysis model while the file's context is built
+        threading.Thread(target=container.llm_service.preload_chat_model, daemon=True).start()
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -282,11 +343,9 @@ def review_command(
         verbose=verbose
     )
 
-    output = formatter.format_review(review)
-
-    # Display or save
+    # Display or save (files are streamed by the formatter, then moved into place)
     if output_file:
-        output_file.write_text(output)
+        _write_report(formatter, review, output_file)
         console.print(f"\n[green]Results saved to {output_file}[/green]")
     elif output_format == "json" and container.config.output.save_to_file:
         # Auto-save JSON to default location
@@ -298,18 +357,18 @@ def review_command(
         project_name = path.name if path.is_dir() else path.stem
         auto_file = output_dir / f"falconeye_{project_name}_{timestamp}.json"
         
-        auto_file.write_text(output)
+        _write_report(formatter, review, auto_file)
         console.print(f"\n[green]Results saved to {auto_file}[/green]")
         
         # Also generate HTML report
         html_formatter = FormatterFactory.create("html")
         html_output = html_formatter.format_review(review)
         html_file = output_dir / f"falconeye_{project_name}_{timestamp}.html"
-        html_file.write_text(html_output)
+        html_file.write_text(html_output, encoding="utf-8")
         console.print(f"[green]HTML report saved to {html_file}[/green]")
     else:
         console.print("")
-        console.print(output)
+        console.print(formatter.format_review(review))
 
 
 def scan_command(
@@ -344,6 +403,10 @@ def scan_command(
         border_style="blue"
     ))
 
+    # Both steps share one container, so plugins, parsers and database
+    # clients are only set up once
+    container = DIContainer.create(config_path)
+
     # Run index first
     console.print("\n[bold]Step 1: Indexing...[/bold]")
     index_command(
@@ -357,6 +420,7 @@ def scan_command(
         config_path=config_path,
         verbose=verbose,
         console=console,
+        container=container,
     )
 
     # Then review
@@ -372,6 +436,7 @@ def scan_command(
         config_path=config_path,
         verbose=verbose,
         console=console,
+        container=container,
     )
 
 
@@ -1,6 +1,7 @@
 """Base formatter interface."""
 
 from abc import ABC, abstractmethod
+from typing import TextIO
 from ...domain.models.security import SecurityReview, SecurityFinding
 
 
@@ -25,6 +26,19 @@ class OutputFormatter(ABC):
         """
         pass
 
+    def write_review(self, review: SecurityReview, stream: TextIO) -> None:
+        """
+        Write a complete security review to a text stream.
+
+        Formatters that can serialize incrementally override this so large
+        reviews are never held in memory as one string.
+
+        Args:
+            review: SecurityReview to format
+            stream: Writable text stream (e.g. an open file)
+        """
+        stream.write(self.format_review(review))
+
     @abstractmethod
     def format_finding(self, finding: SecurityFinding) -> str:
         """
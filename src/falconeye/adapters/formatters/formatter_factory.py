@@ -1,5 +1,7 @@
 """Factory for creating output formatters."""
 
+from functools import lru_cache
+
 from .base_formatter import OutputFormatter
 from .console_formatter import ConsoleFormatter
 from .json_formatter import JSONFormatter
@@ -12,6 +14,8 @@ class FormatterFactory:
     Factory for creating output formatters.
 
     Provides a centralized way to create formatters based on format name.
+    Formatters hold no per-report state, so one instance is created per
+    distinct configuration and reused.
     """
 
     @staticmethod
@@ -38,14 +42,14 @@ class FormatterFactory:
         """
         format_name = format_name.lower()
 
+        # Only pass the options the chosen formatter uses, so calls that
+        # differ in unrelated options share one cached instance
         if format_name == "console":
-            return ConsoleFormatter(use_color=use_color, verbose=verbose)
+            return _build_formatter(format_name, use_color, verbose, True)
         elif format_name == "json":
-            return JSONFormatter(pretty=pretty_json)
-        elif format_name == "sarif":
-            return SARIFFormatter()
-        elif format_name == "html":
-            return HTMLFormatter()
+            return _build_formatter(format_name, True, False, pretty_json)
+        elif format_name in ("sarif", "html"):
+            return _build_formatter(format_name, True, False, True)
         else:
             raise ValueError(
                 f"Unknown format: {format_name}. "
@@ -60,4 +64,33 @@ class FormatterFactory:
         Returns:
             List of format names
         """
-        return ["console", "json", "sarif", "html"]
\ No newline at end of file
+        return ["console", "json", "sarif", "html"]
+
+
+# Every distinct configuration fits: 4 console, 2 JSON, 1 SARIF, 1 HTML
+@lru_cache(maxsize=8)
+def _build_formatter(
+    format_name: str,
+    use_color: bool,
+    verbose: bool,
+    pretty_json: bool,
+) -> OutputFormatter:
+    """
+    Build a formatter instance (cached per configuration).
+
+    Args:
+        format_name: Lower-cased format name
+        use_color: Enable colors (console formatter)
+        verbose: Enable verbose output (console formatter)
+        pretty_json: Enable pretty printing (JSON formatter)
+
+    Returns:
+        OutputFormatter instance
+    """
+    if format_name == "console":
+        return ConsoleFormatter(use_color=use_color, verbose=verbose)
+    elif format_name == "json":
+        return JSONFormatter(pretty=pretty_json)
+    elif format_name == "sarif":
+        return SARIFFormatter()
+    return HTMLFormatter()
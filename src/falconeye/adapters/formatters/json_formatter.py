@@ -1,10 +1,28 @@
 """JSON formatter for machine-readable output."""
 
 import json
-from typing import Dict, Any
+from typing import Dict, Any, TextIO
 from ...domain.models.security import SecurityReview, SecurityFinding
 from .base_formatter import OutputFormatter
 
+try:
+    import orjson
+except ImportError:  # Optional speedup (pip install falconeye[speedups])
+    orjson = None
+
+
+if orjson is not None:
+    def dump_json(data: Any, pretty: bool) -> str:
+        """Serialize report data as JSON text (non-ASCII kept as-is)."""
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(data, default=str, option=option).decode("utf-8")
+else:
+    def dump_json(data: Any, pretty: bool) -> str:
+        """Serialize report data as JSON text (compact like orjson)."""
+        if pretty:
+            return json.dumps(data, indent=2, default=str)
+        return json.dumps(data, separators=(",", ":"), default=str)
+
 
 class JSONFormatter(OutputFormatter):
     """
@@ -33,12 +51,38 @@ class JSONFormatter(OutputFormatter):
         Returns:
             JSON string
         """
-        data = self._review_to_dict(review)
+        return dump_json(self._review_to_dict(review), self.pretty)
+
+    def write_review(self, review: SecurityReview, stream: TextIO) -> None:
+        """
+        Write complete security review as JSON, one finding at a time.
+
+        Produces the same document as format_review without building the
+        whole string, so memory stays flat for reviews with many findings.
 
+        Args:
+            review: SecurityReview to format
+            stream: Writable text stream
+        """
+        # Serialize everything but the findings, then reopen the object
+        header = dump_json(self._review_header_to_dict(review), self.pretty)
+        stream.write(header.rstrip()[:-1].rstrip())
+
+        findings = review.findings
         if self.pretty:
-            return json.dumps(data, indent=2, default=str)
+            stream.write(',\n  "findings": [')
+            for i, finding in enumerate(findings):
+                body = dump_json(self._finding_to_dict(finding), True)
+                stream.write("\n    " if i == 0 else ",\n    ")
+                stream.write(body.replace("\n", "\n    "))
+            stream.write("\n  ]\n}" if findings else "]\n}")
         else:
-            return json.dumps(data, default=str)
+            stream.write(',"findings":[')
+            for i, finding in enumerate(findings):
+                if i:
+                    stream.write(",")
+                stream.write(dump_json(self._finding_to_dict(finding), False))
+            stream.write("]}")
 
     def format_finding(self, finding: SecurityFinding) -> str:
         """
@@ -50,12 +94,7 @@ class JSONFormatter(OutputFormatter):
         Returns:
             JSON string
         """
-        data = self._finding_to_dict(finding)
-
-        if self.pretty:
-            return json.dumps(data, indent=2, default=str)
-        else:
-            return json.dumps(data, default=str)
+        return dump_json(self._finding_to_dict(finding), self.pretty)
 
     def get_file_extension(self) -> str:
         """Get file extension."""
@@ -71,6 +110,20 @@ class JSONFormatter(OutputFormatter):
         Returns:
             Dictionary representation
         """
+        data = self._review_header_to_dict(review)
+        data["findings"] = [self._finding_to_dict(f) for f in review.findings]
+        return data
+
+    def _review_header_to_dict(self, review: SecurityReview) -> Dict[str, Any]:
+        """
+        Convert everything in a SecurityReview except its findings.
+
+        Args:
+            review: SecurityReview to convert
+
+        Returns:
+            Dictionary with the tool, review and summary sections
+        """
         return {
             "tool": {
                 "name": "FalconEYE",
@@ -93,7 +146,6 @@ class JSONFormatter(OutputFormatter):
                 "medium": review.get_medium_count(),
                 "low": review.get_low_count(),
             },
-            "findings": [self._finding_to_dict(f) for f in review.findings],
         }
 
     def _finding_to_dict(self, finding: SecurityFinding) -> Dict[str, Any]:
@@ -1,9 +1,9 @@
 """SARIF formatter for tool integration."""
 
-import json
 from typing import Dict, Any, List
 from ...domain.models.security import SecurityReview, SecurityFinding, Severity
 from .base_formatter import OutputFormatter
+from .json_formatter import dump_json
 
 
 class SARIFFormatter(OutputFormatter):
@@ -35,7 +35,7 @@ class SARIFFormatter(OutputFormatter):
             SARIF JSON string
         """
         sarif = self._create_sarif_document(review)
-        return json.dumps(sarif, indent=2, default=str)
+        return dump_json(sarif, pretty=True)
 
     def format_finding(self, finding: SecurityFinding) -> str:
         """
@@ -48,7 +48,7 @@ class SARIFFormatter(OutputFormatter):
             SARIF result JSON string
         """
         result = self._finding_to_sarif_result(finding)
-        return json.dumps(result, indent=2, default=str)
+        return dump_json(result, pretty=True)
 
     def get_file_extension(self) -> str:
         """Get file extension."""
@@ -1,8 +1,9 @@
 """Index codebase command and handler."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
+import asyncio
 import time
 
 from ...domain.models.codebase import Codebase, CodeFile
@@ -69,6 +70,7 @@ class IndexCodebaseHandler:
         project_identifier: ProjectIdentifier,
         checksum_service: ChecksumService,
         index_registry: IndexRegistryRepository,
+        file_concurrency: int = 4,
     ):
         """
         Initialize handler.
@@ -82,6 +84,8 @@ class IndexCodebaseHandler:
             project_identifier: Project identification service
             checksum_service: File change detection service
             index_registry: Registry for project/file metadata
+            file_concurrency: Number of files processed concurrently, so
+                embedding requests for one file overlap with the next
         """
         self.vector_store = vector_store
         self.metadata_repo = metadata_repo
@@ -91,6 +95,7 @@ class IndexCodebaseHandler:
         self.project_identifier = project_identifier
         self.checksum_service = checksum_service
         self.index_registry = index_registry
+        self.file_concurrency = max(1, file_concurrency)
         self.logger = FalconEyeLogger.get_instance()
 
     async def handle(self, command: IndexCodebaseCommand) -> Codebase:
@@ -141,10 +146,19 @@ class IndexCodebaseHandler:
         )
 
         # Step 2: Detect language
+        # Walk the codebase once for source files; language detection and
+        # file discovery reuse this walk (documents are discovered separately)
+        language_counts, source_paths = (
+            self.language_detector.count_languages(command.codebase_path)
+            if command.codebase_path.is_dir()
+            else (None, None)
+        )
         if command.language:
             language = command.language
         else:
-            language = self.language_detector.detect_language(command.codebase_path)
+            language = self.language_detector.detect_language(
+                command.codebase_path, language_counts=language_counts
+            )
 
         self.logger.info(
             "Language detected",
@@ -173,8 +187,28 @@ class IndexCodebaseHandler:
                 }
             )
 
+        # Stored embeddings from another endpoint, model or dimension cannot
+        # be mixed with new ones; stop (or rebuild the collection, with
+        # force_reindex) before any file is processed
+        rebuild = command.force_reindex
+        if await self.vector_store.ensure_embedding_compatibility(
+            "code", rebuild=rebuild
+        ) and not command.force_reindex:
+            # The rebuilt collection is empty, so every file needs indexing
+            command = replace(command, force_reindex=True)
+        if command.include_documents:
+            # Document checksums are read from the collection itself, so a
+            # rebuilt documents collection re-indexes every document anyway
+            await self.vector_store.ensure_embedding_compatibility(
+                "documents", rebuild=rebuild
+            )
+
         # Step 4: Discover current files
-        files = self._discover_files(command.codebase_path, language, command.excluded_patterns or [])
+        files = self._discover_files(
+            command.codebase_path, language, command.excluded_patterns or [],
+            language_counts=language_counts,
+            source_paths=source_paths,
+        )
 
         self.logger.info(
             "File discovery completed",
@@ -222,20 +256,25 @@ class IndexCodebaseHandler:
         )
 
         # Step 8: Process code files
-        processed_files = []
-        for file_path in files_to_process:
-            # Detect language for each file individually
-            try:
-                file_language = self.language_detector.detect_language(file_path)
-            except Exception:
-                # Fallback to primary language if detection fails
-                file_language = language
-            
-            file_meta = await self._process_file(
-                file_path, file_language, command, codebase, project_id
-            )
-            if file_meta:
-                processed_files.append(file_meta)
+        # A small window of files is in flight at once, so embedding
+        # requests (the dominant cost) overlap instead of running serially
+        semaphore = asyncio.Semaphore(self.file_concurrency)
+
+        async def process(file_path: Path) -> Optional[FileMetadata]:
+            async with semaphore:
+                # Detect language for each file individually
+                try:
+                    file_language = self.language_detector.detect_language(file_path)
+                except Exception:
+                    # Fallback to primary language if detection fails
+                    file_language = language
+
+                return await self._process_file(
+                    file_path, file_language, command, codebase, project_id
+                )
+
+        results = await asyncio.gather(*(process(p) for p in files_to_process))
+        processed_files = [file_meta for file_meta in results if file_meta]
 
         # Step 9: Process documents if enabled
         doc_count = 0
@@ -247,14 +286,25 @@ class IndexCodebaseHandler:
                 extra={"documents_found": len(doc_files)}
             )
 
+            # Checksums of this project's documents already stored, so
+            # unchanged documents are not chunked and embedded again
+            stored_checksums = await self.vector_store.get_document_checksums(
+                project_id,
+                collection="documents"
+            )
+
             for doc_path in doc_files:
-                await self._process_document(doc_path, command)
-                doc_count += 1
+                if await self._process_document(
+                    doc_path, command, project_id, stored_checksums
+                ):
+                    doc_count += 1
 
         # Step 10: Update project metadata in registry
         # Detect all languages for metadata
         try:
-            all_languages = self.language_detector.detect_all_languages(command.codebase_path)
+            all_languages = self.language_detector.detect_all_languages(
+                command.codebase_path, language_counts=language_counts
+            )
         except Exception:
             all_languages = [language]
 
@@ -324,8 +374,11 @@ class IndexCodebaseHandler:
                 }
             )
 
-            # Read file
-            content = file_path.read_text(encoding="utf-8")
+            # Read file once; the same bytes give the registry checksum.
+            # Newlines are normalized as read_text() would do.
+            raw = await asyncio.to_thread(file_path.read_bytes)
+            file_checksum = self.checksum_service.calculate_bytes_checksum(raw)
+            content = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
 
             # Create code file
             code_file = CodeFile.create(
@@ -336,8 +389,10 @@ class IndexCodebaseHandler:
             )
             codebase.add_file(code_file)
 
-            # Extract AST metadata
-            metadata = self.ast_analyzer.analyze_file(
+            # Extract AST metadata on a worker thread so the event loop keeps
+            # serving the other files' embedding requests meanwhile
+            metadata = await asyncio.to_thread(
+                self.ast_analyzer.analyze_file,
                 file_path=str(relative_path),
                 content=content,
             )
@@ -387,6 +442,7 @@ class IndexCodebaseHandler:
                 project_id=project_id,
                 language=language,
                 git_commit_hash=self._get_current_commit(command.codebase_path),
+                file_checksum=file_checksum,
             )
 
             # Update with chunk info
@@ -457,12 +513,18 @@ class IndexCodebaseHandler:
         # Get cached file metadata from registry
         cached_metadata = self.index_registry.get_files_metadata_dict(project_id)
 
-        # Use checksum service to filter changed files
+        # Use checksum service to filter changed files. Files that were only
+        # touched (mtime changed, same size) are verified by checksum instead
+        # of being re-embedded, and their new mtime is written back.
+        refreshed: List[FileMetadata] = []
         changed_files, unchanged_files = self.checksum_service.filter_changed_files_efficient(
             current_files,
             cached_metadata,
-            use_checksum=False,  # Use quick check (mtime + size)
+            use_checksum=True,
+            refreshed=refreshed,
         )
+        if refreshed:
+            self.index_registry.save_files_batch(refreshed)
 
         # Identify new files
         new_files = self.checksum_service.identify_new_files(
@@ -551,6 +613,8 @@ class IndexCodebaseHandler:
         root_path: Path,
         language: str,
         excluded_patterns: List[str],
+        language_counts: Optional[Dict[str, int]] = None,
+        source_paths: Optional[List[Path]] = None,
     ) -> List[Path]:
         """
         Discover source files for ALL languages in the codebase.
@@ -562,13 +626,18 @@ class IndexCodebaseHandler:
             root_path: Root directory
             language: Primary language (kept for backward compatibility, but now indexes all)
             excluded_patterns: Patterns to exclude
+            language_counts: Precomputed counts from LanguageDetector.count_languages()
+            source_paths: Paths from the same count_languages() walk (the
+                codebase is walked again if None)
 
         Returns:
             List of file paths from all detected languages
         """
         # Detect all languages in the codebase
         try:
-            detected_languages = self.language_detector.detect_all_languages(root_path)
+            detected_languages = self.language_detector.detect_all_languages(
+                root_path, language_counts=language_counts
+            )
             self.logger.info(
                 "Multi-language detection completed",
                 extra={
@@ -584,17 +653,20 @@ class IndexCodebaseHandler:
             )
             detected_languages = [language]
 
-        # Collect files from all detected languages
+        # Collect files from all detected languages, reusing the detection
+        # walk when available
+        extensions = tuple(
+            ext
+            for lang in detected_languages
+            for ext in self.language_detector.LANGUAGE_EXTENSIONS.get(lang, [])
+        )
         files = []
-        for lang in detected_languages:
-            extensions = self.language_detector.LANGUAGE_EXTENSIONS.get(lang, [])
-            for ext in extensions:
-                # Find all files with this extension
-                found = list(root_path.rglob(f"*{ext}"))
-                files.extend(found)
-
-        # Remove duplicates (in case of overlapping extensions)
-        files = list(set(files))
+        if extensions:
+            candidates = source_paths if source_paths is not None else root_path.rglob("*")
+            files = [
+                file_path for file_path in candidates
+                if file_path.name.endswith(extensions)
+            ]
 
         # Filter excluded patterns
         filtered_files = []
@@ -759,14 +831,23 @@ class IndexCodebaseHandler:
         self,
         doc_path: Path,
         command: IndexCodebaseCommand,
-    ):
+        project_id: str,
+        stored_checksums: Optional[Dict[str, str]] = None,
+    ) -> bool:
         """
         Process a documentation file.
 
         Args:
             doc_path: Path to document
             command: Index command with settings
+            project_id: Project identifier
+            stored_checksums: Content checksums of the project's already
+                stored documents, keyed by relative path
+
+        Returns:
+            True if the document was (re-)indexed, False if it was skipped
         """
+        stored_checksums = stored_checksums or {}
         start_time = time.time()
         relative_path = str(doc_path.relative_to(command.codebase_path))
 
@@ -783,7 +864,7 @@ class IndexCodebaseHandler:
                         "extension": doc_path.suffix,
                     }
                 )
-                return
+                return False
 
             # Read document with error handling
             try:
@@ -796,7 +877,17 @@ class IndexCodebaseHandler:
                         "error": "UnicodeDecodeError",
                     }
                 )
-                return
+                return False
+
+            # Skip documents whose content is unchanged since the last run
+            content_checksum = self.checksum_service.calculate_content_checksum(content)
+            stored_checksum = stored_checksums.get(relative_path)
+            if stored_checksum == content_checksum and not command.force_reindex:
+                self.logger.debug(
+                    "Skipping unchanged document",
+                    extra={"file_path": relative_path}
+                )
+                return False
 
             self.logger.info(
                 "Starting document processing",
@@ -815,6 +906,8 @@ class IndexCodebaseHandler:
                 relative_path=relative_path,
                 content=content,
                 document_type=doc_type,
+                content_checksum=content_checksum,
+                project_id=project_id,
             )
 
             # Chunk the document
@@ -824,16 +917,39 @@ class IndexCodebaseHandler:
                 chunk_size=command.doc_chunk_size,
             )
 
-            # Generate embeddings in batch
-            texts = [chunk.content for chunk in chunks]
-            embeddings = await self.llm_service.generate_embeddings_batch(texts)
+            # Reuse the vectors of chunks that are unchanged since the
+            # previous version; only new chunk texts are sent to the model
+            known_embeddings: Dict[str, List[float]] = {}
+            if stored_checksum is not None and not command.force_reindex:
+                known_embeddings = await self.vector_store.get_document_chunk_embeddings(
+                    relative_path,
+                    project_id,
+                    collection="documents"
+                )
+
+            # Generate embeddings in batch for unseen chunk texts
+            texts = list(dict.fromkeys(
+                chunk.content for chunk in chunks
+                if chunk.content not in known_embeddings
+            ))
+            if texts:
+                embeddings = await self.llm_service.generate_embeddings_batch(texts)
+                known_embeddings.update(zip(texts, embeddings))
 
             # Add embeddings to chunks
             chunks_with_embeddings = [
-                chunk.with_embedding(embedding)
-                for chunk, embedding in zip(chunks, embeddings)
+                chunk.with_embedding(known_embeddings[chunk.content])
+                for chunk in chunks
             ]
 
+            # Replace the chunks of the previous version of the document
+            if stored_checksum is not None:
+                await self.vector_store.delete_document_chunks(
+                    relative_path,
+                    project_id,
+                    collection="documents"
+                )
+
             # Store chunks in separate collection
             await self.vector_store.store_document_chunks(
                 chunks_with_embeddings,
@@ -849,10 +965,13 @@ class IndexCodebaseHandler:
                     "file_path": relative_path,
                     "doc_type": doc_type,
                     "chunk_count": len(chunks),
+                    "embedded_chunks": len(texts),
                     "duration_seconds": round(duration, 2),
                 }
             )
 
+            return True
+
         except Exception as e:
             duration = time.time() - start_time
             self.logger.error(
@@ -864,6 +983,7 @@ class IndexCodebaseHandler:
                 },
                 exc_info=True
             )
+            return False
 
     def _classify_document(self, filename: str, relative_path: str) -> str:
         """
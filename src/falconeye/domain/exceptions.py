@@ -53,4 +53,9 @@ class OllamaModelNotFoundError(OllamaServiceError):
 
 class OllamaTimeoutError(OllamaServiceError):
     """Raised when Ollama request times out."""
+    pass
+
+
+class EmbeddingMismatchError(FalconEyeDomainError):
+    """Raised when stored embeddings come from a different embedding setup."""
     pass
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Code chunk models for embedding and analysis."""
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence
 from uuid import UUID, uuid4
 
 
@@ -64,6 +64,47 @@ class CodeChunk:
             embedding=embedding,
         )
 
+    @classmethod
+    def from_search_rows(
+        cls,
+        contents: Sequence[str],
+        metadatas: Sequence[ChunkMetadata],
+        embeddings: Optional[Sequence[Optional[list[float]]]] = None,
+        token_counts: Optional[Sequence[Optional[int]]] = None,
+    ) -> List["CodeChunk"]:
+        """
+        Build code chunks for a row of vector search results.
+
+        Token counts stored at index time are used when available; missing
+        ones fall back to a rough estimate (~4 characters per token).
+
+        Args:
+            contents: Chunk contents
+            metadatas: Chunk metadata, aligned with contents
+            embeddings: Optional embeddings, aligned with contents
+            token_counts: Optional stored token counts, aligned with contents
+
+        Returns:
+            List of code chunks
+        """
+        if embeddings is None:
+            embeddings = [None] * len(contents)
+        if token_counts is None:
+            token_counts = [None] * len(contents)
+
+        return [
+            cls(
+                id=uuid4(),
+                content=content,
+                metadata=metadata,
+                token_count=token_count if token_count is not None else len(content) >> 2,
+                embedding=embedding,
+            )
+            for content, metadata, embedding, token_count in zip(
+                contents, metadatas, embeddings, token_counts
+            )
+        ]
+
     def with_embedding(self, embedding: list[float]) -> "CodeChunk":
         """Create a new chunk with embedding."""
         return CodeChunk(
@@ -19,6 +19,8 @@ class DocumentMetadata:
     title: Optional[str] = None
     sections: List[str] = field(default_factory=list)  # Section headings
     keywords: List[str] = field(default_factory=list)
+    content_checksum: Optional[str] = None  # Checksum of the whole document
+    project_id: Optional[str] = None  # Project the document was indexed for
 
     def to_dict(self):
         """Convert to dictionary."""
@@ -28,6 +30,8 @@ class DocumentMetadata:
             "title": self.title,
             "sections": self.sections,
             "keywords": self.keywords,
+            "content_checksum": self.content_checksum,
+            "project_id": self.project_id,
         }
 
 
@@ -119,10 +123,14 @@ class Document:
         relative_path: str,
         content: str,
         document_type: str,
+        content_checksum: Optional[str] = None,
+        project_id: Optional[str] = None,
     ) -> "Document":
         """Create a new document."""
         # Extract metadata
         metadata = cls._extract_metadata(relative_path, content, document_type)
+        metadata.content_checksum = content_checksum
+        metadata.project_id = project_id
 
         return cls(
             path=path,
@@ -1,7 +1,7 @@
 """Vector store repository interface (Port)."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from ..models.code_chunk import CodeChunk
 from ..models.document import DocumentChunk
 
@@ -107,6 +107,47 @@ class VectorStoreRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def check_embedding_compatibility(self, collection: str) -> None:
+        """
+        Verify that a collection's embeddings match the current embedding setup.
+
+        Args:
+            collection: Collection name
+
+        Raises:
+            EmbeddingMismatchError: If the collection was indexed with a
+                different embedding endpoint, model or dimension, or
+                predates embedding signatures
+        """
+        pass
+
+    @abstractmethod
+    async def ensure_embedding_compatibility(
+        self,
+        collection: str,
+        rebuild: bool = False,
+    ) -> bool:
+        """
+        Prepare a collection for indexing with the current embedding setup.
+
+        Collections that predate embedding signatures, or mismatched ones
+        when rebuild is set, are dropped and recreated empty.
+
+        Args:
+            collection: Collection name
+            rebuild: Rebuild a mismatched collection instead of raising
+
+        Returns:
+            True if the collection was rebuilt and must be re-indexed
+
+        Raises:
+            EmbeddingMismatchError: If the collection was indexed with a
+                different embedding endpoint, model or dimension and
+                rebuild is not set
+        """
+        pass
+
     @abstractmethod
     async def store_document_chunks(
         self,
@@ -122,6 +163,61 @@ class VectorStoreRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_document_checksums(
+        self,
+        project_id: str,
+        collection: str = "documents"
+    ) -> Dict[str, str]:
+        """
+        Get the content checksum of every document stored for a project.
+
+        Args:
+            project_id: Project the documents were indexed for
+            collection: Collection name (defaults to "documents")
+
+        Returns:
+            Dictionary mapping document file path to content checksum
+        """
+        pass
+
+    @abstractmethod
+    async def get_document_chunk_embeddings(
+        self,
+        file_path: str,
+        project_id: str,
+        collection: str = "documents"
+    ) -> Dict[str, List[float]]:
+        """
+        Get the stored embeddings of a project's document chunks.
+
+        Args:
+            file_path: Document path as stored in chunk metadata
+            project_id: Project the document was indexed for
+            collection: Collection name (defaults to "documents")
+
+        Returns:
+            Dictionary mapping chunk text to its embedding
+        """
+        pass
+
+    @abstractmethod
+    async def delete_document_chunks(
+        self,
+        file_path: str,
+        project_id: str,
+        collection: str = "documents"
+    ) -> None:
+        """
+        Delete all stored chunks of a project's document.
+
+        Args:
+            file_path: Document path as stored in chunk metadata
+            project_id: Project the document was indexed for
+            collection: Collection name (defaults to "documents")
+        """
+        pass
+
     @abstractmethod
     async def search_similar_documents(
         self,
@@ -8,6 +8,7 @@ This service implements a three-tier strategy for detecting file changes:
 """
 
 import hashlib
+from dataclasses import replace
 from pathlib import Path
 from typing import Optional, Set
 
@@ -26,14 +27,13 @@ class ChecksumService:
 
     def __init__(self):
         """Initialize the checksum service."""
-        self._chunk_size = 65536  # 64KB chunks for streaming SHA256
 
     def calculate_file_checksum(self, file_path: Path) -> str:
         """
         Calculate SHA256 checksum of a file.
 
-        Uses streaming to handle large files efficiently without
-        loading entire file into memory.
+        Uses hashlib.file_digest, which streams the file through a
+        reusable buffer in C without loading it into memory.
 
         Args:
             file_path: Path to file
@@ -45,15 +45,41 @@ class ChecksumService:
             FileNotFoundError: If file doesn't exist
             PermissionError: If file can't be read
         """
-        sha256_hash = hashlib.sha256()
-
         with open(file_path, "rb") as f:
-            # Read file in chunks to avoid memory issues with large files
-            while chunk := f.read(self._chunk_size):
-                sha256_hash.update(chunk)
+            sha256_hash = hashlib.file_digest(f, "sha256")
 
         return f"sha256:{sha256_hash.hexdigest()}"
 
+    def calculate_bytes_checksum(self, data: bytes) -> str:
+        """
+        Calculate SHA256 checksum of file bytes that were already read.
+
+        Produces the same value as calculate_file_checksum for the file
+        the bytes came from, without reading it again.
+
+        Args:
+            data: Raw file content
+
+        Returns:
+            SHA256 checksum as hex string with 'sha256:' prefix
+        """
+        return f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+    def calculate_content_checksum(self, content: str) -> str:
+        """
+        Calculate SHA256 checksum of already-loaded text content.
+
+        Used when the file has been read anyway (e.g. documents), so the
+        content is not read from disk a second time.
+
+        Args:
+            content: Text content
+
+        Returns:
+            SHA256 checksum as hex string with 'sha256:' prefix
+        """
+        return f"sha256:{hashlib.sha256(content.encode('utf-8')).hexdigest()}"
+
     def has_file_changed_quick(
         self, file_path: Path, cached_metadata: Optional[FileMetadata]
     ) -> bool:
@@ -85,7 +111,10 @@ class ChecksumService:
         """
         Accurate check if file has changed using SHA256 checksum.
 
-        This is 100% accurate but slower (requires reading entire file).
+        The file is only read when its mtime or size differs from the
+        cached values; a matching stat() is trusted, as in the quick check.
+        A different size means different content, so that case is also
+        answered without hashing.
 
         Args:
             file_path: Path to file
@@ -98,6 +127,12 @@ class ChecksumService:
             return True  # No cached data, assume changed
 
         try:
+            stat = file_path.stat()
+            if not cached_metadata.has_changed(stat.st_mtime, stat.st_size):
+                return False
+            if stat.st_size != cached_metadata.file_size:
+                return True
+
             current_checksum = self.calculate_file_checksum(file_path)
             return current_checksum != cached_metadata.file_checksum
         except (FileNotFoundError, PermissionError):
@@ -110,6 +145,7 @@ class ChecksumService:
         project_id: str,
         language: str,
         git_commit_hash: Optional[str] = None,
+        file_checksum: Optional[str] = None,
     ) -> FileMetadata:
         """
         Create a metadata snapshot for a file.
@@ -122,6 +158,8 @@ class ChecksumService:
             project_id: Project identifier
             language: Programming language
             git_commit_hash: Git commit hash if in git repo
+            file_checksum: Checksum of the file content if already known
+                (avoids reading the file again)
 
         Returns:
             FileMetadata snapshot
@@ -131,7 +169,7 @@ class ChecksumService:
             PermissionError: If file can't be read
         """
         stat = file_path.stat()
-        checksum = self.calculate_file_checksum(file_path)
+        checksum = file_checksum or self.calculate_file_checksum(file_path)
 
         return FileMetadata(
             project_id=project_id,
@@ -149,6 +187,7 @@ class ChecksumService:
         files: list[Path],
         cached_metadata: dict[Path, FileMetadata],
         use_checksum: bool = False,
+        refreshed: Optional[list[FileMetadata]] = None,
     ) -> tuple[list[Path], list[Path]]:
         """
         Efficiently filter files into changed and unchanged.
@@ -157,10 +196,18 @@ class ChecksumService:
         1. Quick mtime+size check (fast)
         2. Optional SHA256 verification (slower but accurate)
 
+        Files whose size changed are reported as changed without hashing.
+        When a touched file's checksum still matches, its cached entry is
+        updated in place with the new mtime, so persisting the refreshed
+        entries lets the next run decide from stat() alone.
+
         Args:
             files: List of file paths to check
             cached_metadata: Dict mapping file paths to cached metadata
+                (touched-but-unchanged entries are updated in place)
             use_checksum: Whether to verify with SHA256 (slower but accurate)
+            refreshed: Optional list that receives the updated metadata of
+                touched-but-unchanged files, for the caller to persist
 
         Returns:
             Tuple of (changed_files, unchanged_files)
@@ -177,21 +224,40 @@ class ChecksumService:
                 continue
 
             # Stage 1: Quick check with mtime+size
-            if not self.has_file_changed_quick(file_path, cached):
+            try:
+                stat = file_path.stat()
+            except (FileNotFoundError, PermissionError):
+                changed_files.append(file_path)
+                continue
+
+            if not cached.has_changed(stat.st_mtime, stat.st_size):
                 # Definitely unchanged (mtime and size match)
                 unchanged_files.append(file_path)
                 continue
 
-            # Stage 2: mtime or size changed, need deeper check
-            if use_checksum:
-                # Verify with checksum (100% accurate)
-                if self.has_file_changed_checksum(file_path, cached):
+            # Stage 2: only mtime changed, need deeper check
+            if use_checksum and stat.st_size == cached.file_size:
+                # Verify with checksum (100% accurate); stat() was already
+                # compared above, so hash directly
+                try:
+                    content_changed = (
+                        self.calculate_file_checksum(file_path) != cached.file_checksum
+                    )
+                except (FileNotFoundError, PermissionError):
+                    content_changed = True
+
+                if content_changed:
                     changed_files.append(file_path)
                 else:
-                    # File was touched but content unchanged
+                    # File was touched but content unchanged; remember the
+                    # new mtime so it is not hashed again
+                    cached = replace(cached, file_mtime=stat.st_mtime)
+                    cached_metadata[file_path] = cached
+                    if refreshed is not None:
+                        refreshed.append(cached)
                     unchanged_files.append(file_path)
             else:
-                # Assume changed if mtime/size differ
+                # Size differs (content must differ) or no verification
                 changed_files.append(file_path)
 
         return changed_files, unchanged_files
@@ -1,10 +1,13 @@
 """Context assembler domain service."""
 
 from typing import List, Optional, Dict, Any
+import asyncio
 import time
+from ..exceptions import EmbeddingMismatchError
 from ..models.prompt import PromptContext
 from ..repositories.vector_store_repository import VectorStoreRepository
 from ..repositories.metadata_repository import MetadataRepository
+from .llm_service import LLMService
 from ...infrastructure.logging import FalconEyeLogger
 
 
@@ -26,6 +29,7 @@ class ContextAssembler:
         self,
         vector_store: VectorStoreRepository,
         metadata_repo: MetadataRepository,
+        llm_service: Optional[LLMService] = None,
     ):
         """
         Initialize context assembler.
@@ -33,9 +37,13 @@ class ContextAssembler:
         Args:
             vector_store: Vector store for semantic search
             metadata_repo: Metadata repository for structural info
+            llm_service: LLM service used to embed RAG queries. Should be the
+                same service used for indexing so embeddings are consistent;
+                a default Ollama adapter is created on first use if omitted.
         """
         self.vector_store = vector_store
         self.metadata_repo = metadata_repo
+        self.llm_service = llm_service
         self.logger = FalconEyeLogger.get_instance()
 
     async def assemble_context(
@@ -80,20 +88,27 @@ class ContextAssembler:
             }
         )
 
-        # Get structural metadata
-        structural_metadata = await self._get_structural_metadata(file_path)
-
-        # Get related code through semantic search
-        related_code = await self._get_related_code(
-            code_snippet,
-            file_path,
-            top_k_similar,
-        )
-
-        # Get relevant documentation
-        related_docs = await self._get_related_documentation(
-            code_snippet,
-            top_k_docs,
+        # The code and documentation searches share one query embedding,
+        # computed concurrently with the structural metadata lookup
+        embedding_task = asyncio.ensure_future(self._embed_query(code_snippet))
+
+        # Structural metadata, related code (RAG) and relevant documentation
+        # are independent lookups, so run them concurrently. Each one handles
+        # its own errors and returns None on failure, except for an index
+        # built with a different embedding setup.
+        structural_metadata, related_code, related_docs = await asyncio.gather(
+            self._get_structural_metadata(file_path),
+            self._get_related_code(
+                code_snippet,
+                file_path,
+                top_k_similar,
+                embedding_task,
+            ),
+            self._get_related_documentation(
+                code_snippet,
+                top_k_docs,
+                embedding_task,
+            ),
         )
 
         # Assemble context
@@ -167,6 +182,7 @@ class ContextAssembler:
         code_snippet: str,
         current_file: str,
         top_k: int,
+        query_embedding: Optional["asyncio.Future[List[float]]"] = None,
     ) -> Optional[str]:
         """
         Use RAG to find related code chunks.
@@ -181,26 +197,25 @@ class ContextAssembler:
             code_snippet: Code being analyzed
             current_file: File being analyzed (to exclude from results)
             top_k: Number of similar chunks to retrieve
+            query_embedding: Pending query embedding shared with the
+                documentation search (computed here if None)
 
         Returns:
             Formatted related code or None
         """
         try:
             # Generate embedding for query using same LLM as indexing
-            # This is imported lazily to avoid circular imports
-            from ...infrastructure.llm_providers.ollama_adapter import OllamaLLMAdapter
-
-            # Note: In production, LLM service should be injected
-            # For now, create a temporary instance
-            temp_llm = OllamaLLMAdapter()
-            query_embedding = await temp_llm.generate_embedding(code_snippet)
+            if query_embedding is None:
+                embedding = await self._embed_query(code_snippet)
+            else:
+                embedding = await query_embedding
 
             # Semantic search for similar code using consistent embeddings
             similar_chunks = await self.vector_store.search_similar(
                 query=code_snippet,
                 top_k=top_k + 5,  # Get extra in case we need to filter
                 collection="code",
-                query_embedding=query_embedding,
+                query_embedding=embedding,
             )
 
             # Filter out chunks from the current file
@@ -222,6 +237,11 @@ class ContextAssembler:
 
             return "\n".join(related_parts)
 
+        except EmbeddingMismatchError:
+            # An index the query embedding cannot be compared with is a
+            # configuration error, not a missing optional context
+            raise
+
         except Exception as e:
             # Don't fail if RAG retrieval fails
             self.logger.warning(
@@ -238,6 +258,7 @@ class ContextAssembler:
         self,
         code_snippet: str,
         top_k: int,
+        query_embedding: Optional["asyncio.Future[List[float]]"] = None,
     ) -> Optional[str]:
         """
         Use RAG to find relevant documentation.
@@ -252,23 +273,25 @@ class ContextAssembler:
         Args:
             code_snippet: Code being analyzed
             top_k: Number of document chunks to retrieve
+            query_embedding: Pending query embedding shared with the
+                code search (computed here if None)
 
         Returns:
             Formatted documentation or None
         """
         try:
             # Generate embedding for query
-            from ...infrastructure.llm_providers.ollama_adapter import OllamaLLMAdapter
-
-            temp_llm = OllamaLLMAdapter()
-            query_embedding = await temp_llm.generate_embedding(code_snippet)
+            if query_embedding is None:
+                embedding = await self._embed_query(code_snippet)
+            else:
+                embedding = await query_embedding
 
             # Semantic search in documents collection
             doc_chunks = await self.vector_store.search_similar_documents(
                 query=code_snippet,
                 top_k=top_k,
                 collection="documents",
-                query_embedding=query_embedding,
+                query_embedding=embedding,
             )
 
             if not doc_chunks:
@@ -285,6 +308,11 @@ class ContextAssembler:
 
             return "\n".join(doc_parts)
 
+        except EmbeddingMismatchError:
+            # An index the query embedding cannot be compared with is a
+            # configuration error, not a missing optional context
+            raise
+
         except Exception as e:
             # Don't fail if documentation retrieval fails
             self.logger.warning(
@@ -296,6 +324,27 @@ class ContextAssembler:
             )
             return None
 
+    async def _embed_query(self, code_snippet: str) -> List[float]:
+        """
+        Generate the RAG query embedding for a code snippet.
+
+        Reuses the injected LLM service, and its connection pool, for every
+        call. Without one, a default Ollama adapter is created once and kept.
+
+        Args:
+            code_snippet: Code being analyzed
+
+        Returns:
+            Query embedding vector
+        """
+        if self.llm_service is None:
+            # Imported lazily to avoid circular imports
+            from ...infrastructure.llm_providers.ollama_adapter import OllamaLLMAdapter
+
+            self.llm_service = OllamaLLMAdapter()
+
+        return await self.llm_service.generate_embedding(code_snippet)
+
     async def assemble_multi_file_context(
         self,
         file_contexts: List[tuple[str, str, str]],  # (path, code, language)
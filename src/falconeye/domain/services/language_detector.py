@@ -1,7 +1,7 @@
 """Language detection domain service."""
 
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Iterable, Tuple
 from collections import Counter
 from ..exceptions import LanguageDetectionError
 
@@ -50,6 +50,7 @@ class LanguageDetector:
         self,
         codebase_path: Path,
         force_language: Optional[str] = None,
+        language_counts: Optional[Dict[str, int]] = None,
     ) -> str:
         """
         Detect the primary language of a codebase or single file.
@@ -57,6 +58,8 @@ class LanguageDetector:
         Args:
             codebase_path: Root path of codebase or single file
             force_language: Force specific language (skip detection)
+            language_counts: Counts from count_languages() for this codebase,
+                to avoid walking it again
 
         Returns:
             Primary language name
@@ -82,7 +85,8 @@ class LanguageDetector:
             return language
 
         # Count files by language (for directories)
-        language_counts = self._count_files_by_language(codebase_path)
+        if language_counts is None:
+            language_counts = self._count_files_by_language(codebase_path)
 
         if not language_counts:
             raise LanguageDetectionError(
@@ -94,6 +98,34 @@ class LanguageDetector:
 
         return primary_language
 
+    def count_languages(self, root_path: Path) -> Tuple[Dict[str, int], List[Path]]:
+        """
+        Count source files by language with a single walk of the codebase.
+
+        The counts can be passed to detect_language() and
+        detect_all_languages(), and the paths to file discovery, so all of
+        them reuse one walk.
+
+        Args:
+            root_path: Root directory to scan
+
+        Returns:
+            Tuple of (language to file count, every path with a known source
+            extension). The paths are unfiltered: hidden files and skipped
+            directories are left out of the counts only.
+        """
+        extension_to_language = self.EXTENSION_TO_LANGUAGE
+        paths = [
+            item for item in root_path.rglob("*")
+            if item.suffix.lower() in extension_to_language
+        ]
+
+        language_counts: Counter = Counter(
+            extension_to_language[file_path.suffix.lower()]
+            for file_path in self._filter_source_files(paths)
+        )
+        return dict(language_counts), paths
+
     def _count_files_by_language(self, root_path: Path) -> Dict[str, int]:
         """
         Count source files by language.
@@ -125,26 +157,50 @@ class LanguageDetector:
         Yields:
             Path objects for source files
         """
-        for item in root_path.rglob("*"):
-            # Skip directories
-            if item.is_dir():
-                continue
+        return self._filter_source_files(root_path.rglob("*"))
 
-            # Skip if in excluded directory
-            if any(skip_dir in item.parts for skip_dir in self.SKIP_DIRS):
-                continue
+    def _filter_source_files(self, paths: Iterable[Path]):
+        """
+        Yield the source files among paths.
+
+        Skips hidden files, common non-source directories and files.
+
+        Args:
+            paths: Candidate paths
+
+        Yields:
+            Path objects for source files
+        """
+        skip_dirs = self.SKIP_DIRS
+        skip_suffixes = tuple(self.SKIP_PATTERNS)
+        extension_to_language = self.EXTENSION_TO_LANGUAGE
+
+        # Cheapest checks first: name checks need no system call, so the
+        # stat() behind is_dir() only runs for candidate source files
+        for item in paths:
+            name = item.name
 
             # Skip hidden files
-            if item.name.startswith("."):
+            if name.startswith("."):
+                continue
+
+            # Only source files are of interest
+            if item.suffix.lower() not in extension_to_language:
                 continue
 
             # Skip by pattern
-            if any(item.name.endswith(pattern) for pattern in self.SKIP_PATTERNS):
+            if name.endswith(skip_suffixes):
+                continue
+
+            # Skip if in excluded directory (one set lookup per path part)
+            if not skip_dirs.isdisjoint(item.parts):
+                continue
+
+            # Skip directories
+            if item.is_dir():
                 continue
 
-            # Yield if it's a source file
-            if item.suffix.lower() in self.EXTENSION_TO_LANGUAGE:
-                yield item
+            yield item
 
     def _determine_primary_language(
         self,
@@ -250,6 +306,7 @@ class LanguageDetector:
         self,
         codebase_path: Path,
         min_file_threshold: int = 1,
+        language_counts: Optional[Dict[str, int]] = None,
     ) -> List[str]:
         """
         Detect all languages present in a codebase.
@@ -260,6 +317,8 @@ class LanguageDetector:
         Args:
             codebase_path: Root path of codebase
             min_file_threshold: Minimum number of files required to include a language
+            language_counts: Counts from count_languages() for this codebase,
+                to avoid walking it again
 
         Returns:
             List of language names sorted by file count (descending)
@@ -278,7 +337,8 @@ class LanguageDetector:
             return [language]
 
         # Count files by language
-        language_counts = self._count_files_by_language(codebase_path)
+        if language_counts is None:
+            language_counts = self._count_files_by_language(codebase_path)
 
         if not language_counts:
             raise LanguageDetectionError(
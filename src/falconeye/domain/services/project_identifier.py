@@ -16,6 +16,16 @@ from typing import Optional, Tuple
 from ..value_objects.project_metadata import ProjectType
 
 
+# Full SHA-1 or SHA-256 object name
+_SHA_PATTERN = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+
+# Patterns for URL normalization and project ID sanitization, compiled once
+_SSH_URL_PATTERN = re.compile(r"^git@([^:]+):(.+)$")
+_HTTP_SCHEME_PATTERN = re.compile(r"^https?://")
+_UNSAFE_ID_CHARS_PATTERN = re.compile(r"[^a-zA-Z0-9_-]")
+_REPEATED_UNDERSCORE_PATTERN = re.compile(r"_+")
+
+
 class ProjectIdentifier:
     """
     Service for identifying projects and generating unique project IDs.
@@ -161,14 +171,13 @@ class ProjectIdentifier:
 
         # Convert SSH format to HTTPS-like format
         # git@github.com:user/repo → github.com/user/repo
-        ssh_pattern = r"^git@([^:]+):(.+)$"
-        match = re.match(ssh_pattern, url)
+        match = _SSH_URL_PATTERN.match(url)
         if match:
             host, path = match.groups()
             return f"{host}/{path}"
 
         # Remove https:// or http:// prefix
-        url = re.sub(r"^https?://", "", url)
+        url = _HTTP_SCHEME_PATTERN.sub("", url)
 
         return url
 
@@ -186,10 +195,10 @@ class ProjectIdentifier:
             Sanitized project ID
         """
         # Replace spaces and special characters with underscores
-        sanitized = re.sub(r"[^a-zA-Z0-9_-]", "_", project_id)
+        sanitized = _UNSAFE_ID_CHARS_PATTERN.sub("_", project_id)
 
         # Remove consecutive underscores
-        sanitized = re.sub(r"_+", "_", sanitized)
+        sanitized = _REPEATED_UNDERSCORE_PATTERN.sub("_", sanitized)
 
         # Remove leading/trailing underscores
         sanitized = sanitized.strip("_")
@@ -226,6 +235,12 @@ class ProjectIdentifier:
         Returns:
             Commit hash if available, None otherwise
         """
+        # Resolve HEAD from the repository files first; spawning git is only
+        # needed for layouts this does not handle (worktrees, submodules, ...)
+        commit = self._read_git_head(git_root)
+        if commit:
+            return commit
+
         try:
             result = subprocess.run(
                 ["git", "-C", str(git_root), "rev-parse", "HEAD"],
@@ -242,6 +257,43 @@ class ProjectIdentifier:
         except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
             return None
 
+    def _read_git_head(self, git_root: Path) -> Optional[str]:
+        """
+        Resolve the HEAD commit hash by reading the .git directory.
+
+        Handles a detached HEAD, loose refs and packed refs.
+
+        Args:
+            git_root: Path to git repository root
+
+        Returns:
+            Commit hash, or None if it could not be resolved this way
+        """
+        git_dir = git_root / ".git"
+        try:
+            head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+
+            if not head.startswith("ref: "):
+                return head if _SHA_PATTERN.fullmatch(head) else None
+
+            ref = head[len("ref: "):]
+            ref_path = git_dir / ref
+            if ref_path.is_file():
+                commit = ref_path.read_text(encoding="utf-8").strip()
+                return commit if _SHA_PATTERN.fullmatch(commit) else None
+
+            packed_refs = git_dir / "packed-refs"
+            if packed_refs.is_file():
+                for line in packed_refs.read_text(encoding="utf-8").splitlines():
+                    parts = line.split(" ", 1)
+                    if len(parts) == 2 and parts[1] == ref and _SHA_PATTERN.fullmatch(parts[0]):
+                        return parts[0]
+
+            return None
+
+        except (OSError, UnicodeDecodeError):
+            return None
+
     def has_uncommitted_changes(self, git_root: Path) -> bool:
         """
         Check if git repository has uncommitted changes.
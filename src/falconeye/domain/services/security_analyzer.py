@@ -2,6 +2,7 @@
 
 from typing import List
 import json
+import re
 import time
 from ..models.security import SecurityFinding, Severity, FindingConfidence
 from ..models.prompt import PromptContext
@@ -10,6 +11,14 @@ from ..exceptions import AnalysisError, InvalidSecurityFindingError
 from ...infrastructure.logging import FalconEyeLogger
 
 
+# Patterns used to repair malformed JSON in AI responses, compiled once
+_WINDOWS_PATH_PATTERN = re.compile(r'([A-Z]):\\')
+_INVALID_ESCAPE_PATTERN = re.compile(r'\\([^"\\/bfnrtu])')
+_DOUBLE_QUOTED_KEY_PATTERN = re.compile(r'(\$[\w_]+\[)"([^"]+)"\]')
+_SINGLE_QUOTED_KEY_PATTERN = re.compile(r"(\$[\w_]+\[)'([^']+)'\]")
+_TRAILING_COMMA_PATTERN = re.compile(r',\s*([}\]])')
+
+
 class SecurityAnalyzer:
     """
     Domain service for security analysis.
@@ -302,8 +311,6 @@ class SecurityAnalyzer:
         Raises:
             json.JSONDecodeError: If no valid JSON found
         """
-        import re
-        
         # Handle empty or None responses
         if not text or not text.strip():
             self.logger.warning("Received empty AI response")
@@ -391,8 +398,6 @@ class SecurityAnalyzer:
         Returns:
             Fixed JSON string
         """
-        import re
-        
         # Fix invalid escape sequences (e.g., \U, \u followed by invalid hex, etc.)
         # Replace invalid escapes with escaped backslashes
         def fix_escape_sequences(text: str) -> str:
@@ -453,18 +458,16 @@ class SecurityAnalyzer:
         
         # Additional aggressive fix: replace common problematic patterns
         # Fix Windows-style paths (C:\Users\...) 
-        json_text = re.sub(r'([A-Z]):\\', r'\1:\\\\', json_text)
+        json_text = _WINDOWS_PATH_PATTERN.sub(r'\1:\\\\', json_text)
         
         # Fix any remaining single backslashes before common characters
         # This is aggressive but necessary for AI-generated content
-        json_text = re.sub(r'\\([^"\\/bfnrtu])', r'\\\\\\1', json_text)
+        json_text = _INVALID_ESCAPE_PATTERN.sub(r'\\\\\\1', json_text)
         
         # Fix unescaped quotes within strings (common AI error)
         # This is a more aggressive approach that looks for patterns like ["key"]
         def fix_unescaped_quotes(text: str) -> str:
             """Fix unescaped quotes within JSON string values."""
-            import re
-            
             # Fix quotes in patterns like $var["key"] or $_GET["cmd"]
             # Use a callback to properly escape
             def escape_array_access(match):
@@ -472,7 +475,7 @@ class SecurityAnalyzer:
                 key = match.group(2)      # the key
                 return prefix + '\\"' + key + '\\"]'
             
-            text = re.sub(r'(\$[\w_]+\[)"([^"]+)"\]', escape_array_access, text)
+            text = _DOUBLE_QUOTED_KEY_PATTERN.sub(escape_array_access, text)
             
             # Also handle single quotes
             def escape_array_access_single(match):
@@ -480,14 +483,14 @@ class SecurityAnalyzer:
                 key = match.group(2)
                 return prefix + "\\'" + key + "\\']"
             
-            text = re.sub(r"(\$[\w_]+\[)'([^']+)'\]", escape_array_access_single, text)
+            text = _SINGLE_QUOTED_KEY_PATTERN.sub(escape_array_access_single, text)
             
             return text
         
         json_text = fix_unescaped_quotes(json_text)
         
         # Remove trailing commas before closing braces/brackets
-        json_text = re.sub(r',\s*([}\]])', r'\1', json_text)
+        json_text = _TRAILING_COMMA_PATTERN.sub(r'\1', json_text)
         
         # Remove any trailing content after final closing brace/bracket
         json_text = json_text.strip()
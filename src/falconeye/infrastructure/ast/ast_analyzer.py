@@ -1,5 +1,6 @@
 """Enhanced AST analyzer with control flow and data flow analysis."""
 
+import threading
 from pathlib import Path
 from typing import List
 import tree_sitter_language_pack
@@ -26,6 +27,8 @@ class EnhancedASTAnalyzer:
     IMPORTANT: This analyzer extracts metadata for AI context,
     NOT for pattern-based vulnerability detection.
     All security analysis is performed by the AI.
+
+    analyze_file() may be called from several threads concurrently.
     """
 
     # Language mapping
@@ -52,6 +55,11 @@ class EnhancedASTAnalyzer:
         self.parsers = {}
         self._init_parsers()
 
+        # Tree-sitter parsers must not be used by two threads at once, so
+        # threads other than the creating one get their own parsers
+        self._owner_thread = threading.get_ident()
+        self._thread_local = threading.local()
+
     def _init_parsers(self):
         """Initialize Tree-sitter parsers for supported languages."""
         for lang in set(self.LANGUAGE_MAP.values()):
@@ -61,6 +69,28 @@ class EnhancedASTAnalyzer:
             except Exception as e:
                 print(f"Warning: Could not initialize parser for {lang}: {e}")
 
+    def _get_parser(self, language: str):
+        """
+        Get a parser for a language that is safe to use on the calling thread.
+
+        Args:
+            language: Language name (must be in self.parsers)
+
+        Returns:
+            Tree-sitter parser
+        """
+        if threading.get_ident() == self._owner_thread:
+            return self.parsers[language]
+
+        parsers = getattr(self._thread_local, "parsers", None)
+        if parsers is None:
+            parsers = self._thread_local.parsers = {}
+
+        parser = parsers.get(language)
+        if parser is None:
+            parser = parsers[language] = tree_sitter_language_pack.get_parser(language)
+        return parser
+
     def analyze_file(
         self,
         file_path: str,
@@ -88,7 +118,7 @@ class EnhancedASTAnalyzer:
             )
 
         # Parse code
-        parser = self.parsers[language]
+        parser = self._get_parser(language)
         tree = parser.parse(bytes(content, "utf8"))
         root = tree.root_node
 
@@ -1,8 +1,9 @@
 """Configuration loader with support for YAML files and environment variables."""
 
+import copy
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import yaml
 
 from .config_models import FalconEyeConfig
@@ -26,6 +27,10 @@ class ConfigLoader:
         Path("./.falconeye.yaml"),
     ]
 
+    # Parsed YAML files keyed by resolved path, with the (mtime, size)
+    # they were parsed at; a changed file is parsed again
+    _yaml_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
     @classmethod
     def load(cls, config_path: Optional[str] = None) -> FalconEyeConfig:
         """
@@ -67,23 +72,35 @@ class ConfigLoader:
         # Create and validate configuration
         return FalconEyeConfig(**config_dict)
 
-    @staticmethod
-    def _load_yaml_file(path: Path) -> Dict[str, Any]:
+    @classmethod
+    def _load_yaml_file(cls, path: Path) -> Dict[str, Any]:
         """
         Load YAML configuration file.
 
+        Parsed files are cached per process and re-parsed only when their
+        modification time or size changes.
+
         Args:
             path: Path to YAML file
 
         Returns:
-            Configuration dictionary
+            Configuration dictionary (a copy the caller may modify)
         """
-        try:
-            with open(path, 'r') as f:
-                data = yaml.safe_load(f)
-                return data if data else {}
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML in {path}: {e}")
+        resolved = path.resolve()
+        stat = resolved.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        cached = cls._yaml_cache.get(resolved)
+        if cached is None or cached[0] != signature:
+            try:
+                with open(resolved, 'r') as f:
+                    data = yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise ValueError(f"Invalid YAML in {path}: {e}")
+            cached = (signature, data if data else {})
+            cls._yaml_cache[resolved] = cached
+
+        return copy.deepcopy(cached[1])
 
     @staticmethod
     def _merge_dicts(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
@@ -1,6 +1,6 @@
 """Configuration data models using Pydantic."""
 
-from typing import List
+from typing import List, Optional, Union
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
 
@@ -14,6 +14,18 @@ class LLMModelConfig(BaseModel):
         default="embeddinggemma:300m",
         description="Model for generating embeddings"
     )
+    embedding_dimensions: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Truncate embeddings to this many dimensions and re-normalize "
+            "(Matryoshka-trained models only; re-index after changing)"
+        )
+    )
+    embedding_cache_path: Optional[str] = Field(
+        default=None,
+        description="File for a persistent embedding cache shared across runs"
+    )
 
 
 class RetryConfigModel(BaseModel):
@@ -48,6 +60,20 @@ class RetryConfigModel(BaseModel):
         le=0.5,
         description="Jitter factor (0.1 = ±10% randomness)"
     )
+    jitter_strategy: str = Field(
+        default="additive",
+        description="Jitter strategy (none, additive, full, decorrelated)"
+    )
+
+    @field_validator('jitter_strategy')
+    @classmethod
+    def validate_jitter_strategy(cls, v):
+        """Ensure jitter strategy is valid."""
+        valid_strategies = ["none", "additive", "full", "decorrelated"]
+        v = v.lower()
+        if v not in valid_strategies:
+            raise ValueError(f"jitter_strategy must be one of {valid_strategies}")
+        return v
 
 
 class CircuitBreakerConfigModel(BaseModel):
@@ -89,6 +115,10 @@ class LLMConfig(BaseModel):
         le=600,
         description="Request timeout in seconds"
     )
+    keep_alive: Optional[Union[str, float]] = Field(
+        default="30m",
+        description="How long Ollama keeps models loaded between requests"
+    )
     max_retries: int = Field(
         default=3,
         ge=0,
@@ -119,6 +149,54 @@ class VectorStoreConfig(BaseModel):
         default="falconeye",
         description="Prefix for collection names"
     )
+    semantic_cache_threshold: Optional[float] = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Cosine similarity at which a near-duplicate query reuses cached results (None disables)"
+    )
+    query_workers: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Threads used to run vector store queries off the event loop"
+    )
+    prefer_post_filter: bool = Field(
+        default=False,
+        description="Apply simple search filters in Python on over-fetched results instead of a where clause"
+    )
+    over_fetch: int = Field(
+        default=4,
+        ge=1,
+        le=20,
+        description="Multiple of top_k retrieved when post-filtering search results"
+    )
+    sqlite_tuning: bool = Field(
+        default=False,
+        description="Apply WAL, cache and mmap PRAGMAs to ChromaDB's sqlite backend (best effort)"
+    )
+    ingest_mode: bool = Field(
+        default=False,
+        description="Also disable fsync and lock the database exclusively for one-shot offline indexing (not crash-safe)"
+    )
+    hnsw_m: int = Field(
+        default=32,
+        ge=2,
+        le=128,
+        description="HNSW graph degree for new collections"
+    )
+    hnsw_construction_ef: int = Field(
+        default=100,
+        ge=10,
+        le=1000,
+        description="HNSW candidate list size while building new collections"
+    )
+    hnsw_search_ef: int = Field(
+        default=64,
+        ge=10,
+        le=1000,
+        description="HNSW candidate list size at query time for new collections"
+    )
 
 
 class MetadataConfig(BaseModel):
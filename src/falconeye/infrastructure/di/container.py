@@ -1,7 +1,7 @@
 """Dependency injection container for FalconEYE."""
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 from pathlib import Path
 
 from ..config.config_loader import ConfigLoader
@@ -53,6 +53,9 @@ class DIContainer:
     index_handler: IndexCodebaseHandler
     review_file_handler: ReviewFileHandler
 
+    # System prompts resolved per language (plugins are loaded once)
+    _system_prompts: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+
     @classmethod
     def create(cls, config_path: Optional[str] = None) -> "DIContainer":
         """
@@ -82,6 +85,7 @@ class DIContainer:
             max_delay=config.llm.retry.max_delay,
             exponential_base=config.llm.retry.exponential_base,
             jitter=config.llm.retry.jitter,
+            jitter_strategy=config.llm.retry.jitter_strategy,
             retryable_exceptions=(ConnectionError, TimeoutError, OSError)
         )
 
@@ -97,6 +101,9 @@ class DIContainer:
             host=config.llm.base_url,
             chat_model=config.llm.model.analysis,
             embedding_model=config.llm.model.embedding,
+            embedding_dimensions=config.llm.model.embedding_dimensions,
+            embedding_cache_path=config.llm.model.embedding_cache_path,
+            keep_alive=config.llm.keep_alive,
             retry_config=retry_config,
             circuit_breaker_config=circuit_breaker_config,
         )
@@ -104,11 +111,27 @@ class DIContainer:
         vector_store = ChromaVectorStoreAdapter(
             persist_directory=config.vector_store.persist_directory,
             collection_prefix=config.vector_store.collection_prefix,
+            semantic_cache_threshold=config.vector_store.semantic_cache_threshold,
+            query_workers=config.vector_store.query_workers,
+            prefer_post_filter=config.vector_store.prefer_post_filter,
+            over_fetch=config.vector_store.over_fetch,
+            sqlite_tuning=config.vector_store.sqlite_tuning,
+            ingest_mode=config.vector_store.ingest_mode,
+            hnsw_m=config.vector_store.hnsw_m,
+            hnsw_construction_ef=config.vector_store.hnsw_construction_ef,
+            hnsw_search_ef=config.vector_store.hnsw_search_ef,
+            embedding_signature=llm_service.embedding_signature,
         )
 
+        # Metadata configured in the vector store's directory shares its client
+        shares_vector_store_dir = (
+            Path(config.metadata.persist_directory).resolve()
+            == Path(config.vector_store.persist_directory).resolve()
+        )
         metadata_repo = ChromaMetadataRepository(
             persist_directory=config.metadata.persist_directory,
             collection_name=config.metadata.collection_name,
+            client=vector_store.client if shares_vector_store_dir else None,
         )
 
         index_registry = ChromaIndexRegistryAdapter(
@@ -123,7 +146,7 @@ class DIContainer:
 
         # Domain services - Business logic
         security_analyzer = SecurityAnalyzer(llm_service)
-        context_assembler = ContextAssembler(vector_store, metadata_repo)
+        context_assembler = ContextAssembler(vector_store, metadata_repo, llm_service)
         language_detector = LanguageDetector()
         project_identifier = ProjectIdentifier()
         checksum_service = ChecksumService()
@@ -166,12 +189,30 @@ class DIContainer:
         """
         Get system prompt for a language.
 
+        The prompt is resolved once per language and reused for every
+        subsequent file review.
+
         Args:
             language: Language name
 
         Returns:
             System prompt string
         """
+        prompt = self._system_prompts.get(language)
+        if prompt is None:
+            prompt = self._system_prompts[language] = self._resolve_system_prompt(language)
+        return prompt
+
+    def _resolve_system_prompt(self, language: str) -> str:
+        """
+        Look up the system prompt for a language from its plugin.
+
+        Args:
+            language: Language name
+
+        Returns:
+            Plugin system prompt, or a generic prompt if no plugin exists
+        """
         plugin = self.plugin_registry.get_plugin(language)
         if plugin:
             return plugin.get_system_prompt()
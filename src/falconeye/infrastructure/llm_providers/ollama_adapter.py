@@ -1,8 +1,17 @@
 """Ollama LLM adapter implementation."""
 
 import asyncio
-from typing import List
+import atexit
+import dbm
+import hashlib
+import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Union
 import time
+import httpx
+import numpy as np
 import ollama
 from ...domain.services.llm_service import LLMService
 from ...domain.models.prompt import PromptContext
@@ -15,6 +24,68 @@ from ..resilience import (
 )
 
 
+class _ReviewsJsonWatcher:
+    """
+    Watch a streamed chat response for a complete {"reviews": ...} object.
+
+    Braces are counted incrementally (ignoring those inside JSON strings);
+    each balanced top-level object is parsed once, so prose containing
+    stray braces before the JSON does not end the stream early.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self._pos = 0
+        self._start = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Append a streamed chunk.
+
+        Args:
+            chunk: Next piece of response text
+
+        Returns:
+            True once the response contains a complete reviews object
+        """
+        self.text += chunk
+        text = self.text
+
+        for i in range(self._pos, len(text)):
+            c = text[i]
+            if self._depth == 0:
+                if c == "{":
+                    self._start = i
+                    self._depth = 1
+            elif self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+            elif c == '"':
+                self._in_string = True
+            elif c == "{":
+                self._depth += 1
+            elif c == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        parsed = json.loads(text[self._start:i + 1])
+                    except ValueError:
+                        continue
+                    if isinstance(parsed, dict) and "reviews" in parsed:
+                        self._pos = i + 1
+                        return True
+
+        self._pos = len(text)
+        return False
+
+
 class OllamaLLMAdapter(LLMService):
     """
     Ollama LLM adapter for local AI-powered analysis.
@@ -37,6 +108,12 @@ class OllamaLLMAdapter(LLMService):
         max_response_tokens: int = 8192,
         retry_config: RetryConfig = None,
         circuit_breaker_config: CircuitBreakerConfig = None,
+        embedding_batch_size: int = 32,
+        embedding_cache_size: int = 256,
+        embedding_dimensions: Optional[int] = None,
+        embedding_cache_path: Optional[str] = None,
+        keep_alive: Optional[Union[str, float]] = "30m",
+        embedding_concurrency: int = 4,
     ):
         """
         Initialize Ollama adapter.
@@ -50,6 +127,20 @@ class OllamaLLMAdapter(LLMService):
             max_response_tokens: Max tokens in response
             retry_config: Retry configuration (uses defaults if None)
             circuit_breaker_config: Circuit breaker configuration (uses defaults if None)
+            embedding_batch_size: Maximum texts sent in one embedding request
+            embedding_cache_size: Number of single-text (query) embeddings
+                kept in memory (0 disables)
+            embedding_dimensions: Truncate embeddings to this many leading
+                dimensions and L2-renormalize (Matryoshka-trained models
+                only; None keeps the model's native size)
+            embedding_cache_path: File for a persistent embedding cache
+                shared across runs (None disables)
+            keep_alive: How long Ollama keeps the models loaded after a
+                request (e.g. "30m", or -1 for forever; None uses the
+                server default of 5 minutes)
+            embedding_concurrency: Maximum embedding requests in flight at
+                once; further sub-batches queue locally instead of piling up
+                in Ollama's request queue
         """
         self.host = host
         self.chat_model = chat_model
@@ -57,9 +148,40 @@ class OllamaLLMAdapter(LLMService):
         self.chat_max_tokens = chat_max_tokens
         self.temperature = temperature
         self.max_response_tokens = max_response_tokens
+        self.embedding_batch_size = max(1, embedding_batch_size)
+        self.embedding_dimensions = embedding_dimensions
+        self.keep_alive = keep_alive
+
+        # LRU cache of query embeddings: (model, sha1 of text) -> vector
+        self.embedding_cache_size = embedding_cache_size
+        self._embedding_cache: "OrderedDict[tuple, List[float]]" = OrderedDict()
+
+        # Dedicated pool bounding concurrent embedding requests. A thread
+        # pool (rather than an asyncio.Semaphore) works across the separate
+        # event loops the CLI starts with asyncio.run().
+        self._embed_executor = ThreadPoolExecutor(
+            max_workers=max(1, embedding_concurrency),
+            thread_name_prefix="falconeye-embed",
+        )
 
-        # Initialize Ollama client
-        self.client = ollama.Client(host=host)
+        # Persistent cache: sha256(model, dimensions, text) -> float32 bytes,
+        # opened on first use so that merely constructing the adapter does
+        # not take the database lock
+        self.embedding_cache_path = embedding_cache_path
+        self._disk_cache = None
+
+        # Initialize Ollama client. Sub-batch embeddings run in parallel
+        # executor threads and chat calls leave connections idle for long
+        # stretches, so keep more pooled connections alive for longer than
+        # the httpx defaults (20 connections, 5s expiry).
+        self.client = ollama.Client(
+            host=host,
+            limits=httpx.Limits(
+                max_keepalive_connections=40,
+                max_connections=100,
+                keepalive_expiry=30.0,
+            ),
+        )
 
         # Initialize logger
         self.logger = FalconEyeLogger.get_instance()
@@ -126,6 +248,7 @@ class OllamaLLMAdapter(LLMService):
                 response = await self._call_ollama(
                     system_prompt=system_prompt,
                     user_prompt=user_prompt,
+                    stop_after_reviews=True,
                 )
 
                 duration = time.time() - start_time
@@ -157,25 +280,52 @@ class OllamaLLMAdapter(LLMService):
                 )
                 raise
 
+    @property
+    def embedding_signature(self) -> str:
+        """
+        Identify the vector space this adapter's embeddings live in.
+
+        /api/embed returns L2-normalized vectors, unlike the older
+        /api/embeddings endpoint, and Matryoshka truncation changes the
+        dimension, so vectors are only comparable within one signature.
+
+        Returns:
+            Signature string of endpoint, model and dimensions
+        """
+        return f"ollama/api/embed:{self.embedding_model}:{self.embedding_dimensions or 'native'}"
+
     async def generate_embedding(self, text: str) -> List[float]:
         """
         Generate embedding vector for text.
 
+        Repeated texts (e.g. the same snippet embedded for several RAG
+        lookups) are served from an in-memory LRU cache.
+
         Args:
             text: Text to embed
 
         Returns:
-            Embedding vector
+            Embedding vector (shared with the cache; do not modify)
         """
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: self.client.embeddings(
-                model=self.embedding_model,
-                prompt=text,
+        cache_key = None
+        if self.embedding_cache_size > 0:
+            cache_key = (
+                self.embedding_model,
+                hashlib.sha1(text.encode("utf-8")).digest(),
             )
-        )
-        return response["embedding"]
+            cached = self._embedding_cache.get(cache_key)
+            if cached is not None:
+                self._embedding_cache.move_to_end(cache_key)
+                return cached
+
+        embedding = (await self._embed_cached([text]))[0]
+
+        if cache_key is not None:
+            self._embedding_cache[cache_key] = embedding
+            if len(self._embedding_cache) > self.embedding_cache_size:
+                self._embedding_cache.popitem(last=False)
+
+        return embedding
 
     async def generate_embeddings_batch(
         self,
@@ -205,9 +355,7 @@ class OllamaLLMAdapter(LLMService):
             )
 
             try:
-                # Process in parallel
-                tasks = [self.generate_embedding(text) for text in texts]
-                embeddings = await asyncio.gather(*tasks)
+                embeddings = await self._embed_cached(texts)
 
                 duration = time.time() - start_time
                 avg_time_per_embedding = duration / batch_size if batch_size > 0 else 0
@@ -240,6 +388,124 @@ class OllamaLLMAdapter(LLMService):
                 )
                 raise
 
+    async def _embed_cached(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts, serving repeats from the persistent cache.
+
+        Only cache misses are sent to Ollama, one /api/embed request per
+        sub-batch instead of one request per text; up to
+        embedding_concurrency sub-batches run in parallel.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors in input order
+        """
+        disk_cache = self._get_disk_cache()
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        keys: List[bytes] = []
+
+        if disk_cache is not None:
+            prefix = f"{self.embedding_model}:{self.embedding_dimensions}:"
+            for i, text in enumerate(texts):
+                key = hashlib.sha256((prefix + text).encode("utf-8")).digest()
+                keys.append(key)
+                cached = disk_cache.get(key)
+                if cached is not None:
+                    embeddings[i] = np.frombuffer(cached, dtype=np.float32).tolist()
+
+        misses = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if not misses:
+            return embeddings
+
+        loop = asyncio.get_event_loop()
+        step = self.embedding_batch_size
+        results = await asyncio.gather(*[
+            loop.run_in_executor(
+                self._embed_executor,
+                self._embed,
+                [texts[i] for i in misses[start:start + step]],
+            )
+            for start in range(0, len(misses), step)
+        ])
+
+        fresh = (embedding for result in results for embedding in result)
+        for i, embedding in zip(misses, fresh):
+            embeddings[i] = embedding
+            if disk_cache is not None:
+                disk_cache[keys[i]] = np.asarray(embedding, dtype=np.float32).tobytes()
+
+        if disk_cache is not None and hasattr(disk_cache, "sync"):
+            disk_cache.sync()
+
+        return embeddings
+
+    def _get_disk_cache(self):
+        """
+        Open the persistent embedding cache on first use.
+
+        If it cannot be opened (typically because another process holds
+        its lock), the persistent cache is disabled for this adapter and
+        only the in-memory query cache is used.
+
+        Returns:
+            Open dbm database, or None if disabled or unavailable
+        """
+        if self._disk_cache is None and self.embedding_cache_path:
+            try:
+                Path(self.embedding_cache_path).parent.mkdir(parents=True, exist_ok=True)
+                self._disk_cache = dbm.open(self.embedding_cache_path, "c")
+            except dbm.error as e:
+                self.logger.warning(
+                    "Persistent embedding cache unavailable, using in-memory cache only",
+                    extra={
+                        "embedding_cache_path": self.embedding_cache_path,
+                        "error": str(e),
+                    }
+                )
+                self.embedding_cache_path = None
+            else:
+                atexit.register(self.close)
+        return self._disk_cache
+
+    def close(self) -> None:
+        """Close the persistent embedding cache, if it is open."""
+        if self._disk_cache is not None:
+            atexit.unregister(self.close)
+            self._disk_cache.close()
+            self._disk_cache = None
+
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts in a single Ollama request (blocking).
+
+        Both the single and batch paths go through /api/embed so query and
+        index embeddings are always produced the same way.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors in input order
+        """
+        response = self.client.embed(
+            model=self.embedding_model,
+            input=texts,
+            keep_alive=self.keep_alive,
+        )
+        embeddings = response["embeddings"]
+
+        if self.embedding_dimensions is None:
+            return list(embeddings)
+
+        # Matryoshka truncation: keep the leading dimensions and
+        # re-normalize so cosine/L2 distances stay comparable
+        matrix = np.asarray(embeddings, dtype=np.float32)[:, :self.embedding_dimensions]
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (matrix / norms).tolist()
+
     async def validate_findings(
         self,
         code_snippet: str,
@@ -287,6 +553,7 @@ Validate these findings and return only genuine security issues."""
         response = await self._call_ollama(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
+            stop_after_reviews=True,
         )
 
         return response
@@ -333,6 +600,29 @@ Create a concise but comprehensive summary of all identified issues."""
         # Rough estimate: ~4 characters per token
         return len(text) // 4
 
+    def preload_chat_model(self) -> None:
+        """
+        Load the analysis model into Ollama ahead of the first review.
+
+        A chat request without messages only loads the model, so the
+        multi-second cold start overlaps with other setup work. Failures
+        are logged and ignored; the first real request will load it.
+        """
+        try:
+            self.client.chat(
+                model=self.chat_model,
+                messages=[],
+                keep_alive=self.keep_alive,
+            )
+        except Exception as e:
+            self.logger.debug(
+                "Chat model preload failed",
+                extra={
+                    "model": self.chat_model,
+                    "error_type": type(e).__name__,
+                }
+            )
+
     async def health_check(self) -> bool:
         """
         Check if Ollama service is available.
@@ -362,6 +652,7 @@ Create a concise but comprehensive summary of all identified issues."""
         self,
         system_prompt: str,
         user_prompt: str,
+        stop_after_reviews: bool = False,
     ) -> str:
         """
         Internal method to call Ollama API with retry and circuit breaker.
@@ -373,6 +664,9 @@ Create a concise but comprehensive summary of all identified issues."""
         Args:
             system_prompt: System instructions
             user_prompt: User query
+            stop_after_reviews: Stream the response and stop generation as
+                soon as a complete {"reviews": ...} JSON object has arrived,
+                instead of waiting for any trailing commentary
 
         Returns:
             AI response text
@@ -390,21 +684,42 @@ Create a concise but comprehensive summary of all identified issues."""
                 {"role": "user", "content": user_prompt},
             ]
 
-            # Run in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.client.chat(
+            options = {
+                "temperature": self.temperature,
+                "num_ctx": self.chat_max_tokens,
+                "num_predict": self.max_response_tokens,
+            }
+
+            def chat() -> str:
+                if not stop_after_reviews:
+                    response = self.client.chat(
+                        model=self.chat_model,
+                        messages=messages,
+                        options=options,
+                        keep_alive=self.keep_alive,
+                    )
+                    return response["message"]["content"]
+
+                # Closing the stream drops the connection, which makes
+                # Ollama stop generating the rest of the response
+                watcher = _ReviewsJsonWatcher()
+                stream = self.client.chat(
                     model=self.chat_model,
                     messages=messages,
-                    options={
-                        "temperature": self.temperature,
-                        "num_ctx": self.chat_max_tokens,
-                        "num_predict": self.max_response_tokens,
-                    },
+                    options=options,
+                    keep_alive=self.keep_alive,
+                    stream=True,
                 )
-            )
+                try:
+                    for chunk in stream:
+                        if watcher.feed(chunk["message"]["content"]):
+                            break
+                finally:
+                    stream.close()
+                return watcher.text
 
-            return response["message"]["content"]
+            # Run in executor to avoid blocking
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, chat)
 
         return await _call_with_protection()
\ No newline at end of file
@@ -69,10 +69,13 @@ class JSONFormatter(logging.Formatter):
 
         # Add exception info if present
         if record.exc_info:
+            # Reuse the traceback text if another handler already formatted it
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
             log_data["exception"] = {
                 "type": record.exc_info[0].__name__,
                 "message": str(record.exc_info[1]),
-                "traceback": self.formatException(record.exc_info)
+                "traceback": record.exc_text
             }
 
         return json.dumps(log_data)
@@ -240,6 +243,10 @@ class FalconEyeLogger:
 
         return kwargs
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether a message at the given level would be emitted."""
+        return self.logger.isEnabledFor(level)
+
     def debug(self, message: str, **kwargs):
         """Log debug message with automatic context injection."""
         kwargs = self._merge_context(kwargs)
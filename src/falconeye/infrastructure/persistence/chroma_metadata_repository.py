@@ -4,11 +4,18 @@ import json
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import chromadb
+from chromadb.api import ClientAPI
 from chromadb.config import Settings
 
 from ...domain.repositories.metadata_repository import MetadataRepository
 from ...domain.models.structural import StructuralMetadata
 
+# Metadata is only ever fetched by ID, never by similarity. Upserting without
+# embeddings would make ChromaDB run its default ONNX embedding model over
+# every metadata JSON document, so a constant vector is stored instead. It
+# has the default model's dimension (384) so existing collections accept it.
+_PLACEHOLDER_EMBEDDING = [0.0] * 384
+
 
 class ChromaMetadataRepository(MetadataRepository):
     """
@@ -22,6 +29,7 @@ class ChromaMetadataRepository(MetadataRepository):
         self,
         persist_directory: str = "./chromadb",
         collection_name: str = "falconeye_metadata",
+        client: Optional[ClientAPI] = None,
     ):
         """
         Initialize metadata repository.
@@ -29,6 +37,8 @@ class ChromaMetadataRepository(MetadataRepository):
         Args:
             persist_directory: Directory for ChromaDB persistence
             collection_name: Collection name for metadata
+            client: Existing ChromaDB client for persist_directory to share
+                (a new PersistentClient is created if None)
         """
         self.persist_directory = Path(persist_directory)
         self.collection_name = collection_name
@@ -37,7 +47,7 @@ class ChromaMetadataRepository(MetadataRepository):
         self.persist_directory.mkdir(parents=True, exist_ok=True)
 
         # Initialize ChromaDB client
-        self.client = chromadb.PersistentClient(
+        self.client = client or chromadb.PersistentClient(
             path=str(self.persist_directory),
             settings=Settings(
                 anonymized_telemetry=False,
@@ -70,6 +80,7 @@ class ChromaMetadataRepository(MetadataRepository):
         # Store in ChromaDB
         self.collection.upsert(
             ids=[doc_id],
+            embeddings=[_PLACEHOLDER_EMBEDDING],
             documents=[metadata_json],
             metadatas=[{
                 "file_path": metadata.file_path,
@@ -221,13 +232,28 @@ class ChromaMetadataRepository(MetadataRepository):
             include=["documents"]
         )
 
+        needle = function_name.lower()
+        # A name can only match if the needle appears in the raw JSON, so
+        # most files are rejected without parsing them. Skipped when JSON
+        # escaping could hide a match (quotes, backslashes, control or
+        # non-ASCII characters).
+        prefilter = (
+            needle.isascii()
+            and needle.isprintable()
+            and '"' not in needle
+            and "\\" not in needle
+        )
+
         matches = []
         for doc in results["documents"]:
+            if prefilter and "\\u" not in doc and needle not in doc.lower():
+                continue
+
             metadata_dict = json.loads(doc)
             file_path = metadata_dict["file_path"]
 
             for func in metadata_dict.get("functions", []):
-                if function_name.lower() in func.get("name", "").lower():
+                if needle in func.get("name", "").lower():
                     matches.append({
                         "file_path": file_path,
                         "function_name": func["name"],
@@ -9,6 +9,7 @@ import traceback
 from typing import Tuple, List
 
 from ...domain.exceptions import (
+    EmbeddingMismatchError,
     OllamaConnectionError,
     OllamaModelNotFoundError,
     OllamaTimeoutError,
@@ -100,6 +101,18 @@ class ErrorPresenter:
                 ]
             )
 
+        # EmbeddingMismatchError
+        if isinstance(error, EmbeddingMismatchError):
+            return (
+                "The index was built with a different embedding setup",
+                [
+                    "Embeddings from different endpoints, models or dimensions cannot be compared",
+                    error_str,
+                    "Rebuild the index: `falconeye index <path> --force-reindex`",
+                    "Or restore the previous llm.model.embedding / embedding_dimensions settings",
+                ]
+            )
+
         # FileNotFoundError
         if isinstance(error, FileNotFoundError):
             file_path = str(error).replace("File not found: ", "").replace("[Errno 2] No such file or directory: ", "").strip("'\"")
@@ -6,8 +6,11 @@ in external service calls (LLM, vector store, etc.).
 """
 
 import asyncio
+import logging
+import random
 import time
-from typing import Optional, Callable, Any, Type, Tuple
+from collections import OrderedDict
+from typing import Optional, Callable, Any, Type, Tuple, Dict
 from dataclasses import dataclass
 from functools import wraps
 
@@ -25,18 +28,140 @@ class RetryConfig:
         max_delay: Maximum delay in seconds between retries
         exponential_base: Base for exponential backoff (typically 2)
         jitter: Add random jitter to prevent thundering herd (0.0 to 1.0)
+        jitter_strategy: How jitter is applied to the backoff delay:
+            "none" (plain exponential), "additive" (delay + up to jitter * delay),
+            "full" (uniform in [0, delay]) or "decorrelated"
+            (uniform in [initial_delay, 3 * previous delay], capped at max_delay)
         retryable_exceptions: Tuple of exception types that should trigger retry
+        result_cache_ttl: Seconds to serve a repeated identical call from the
+            last successful result (None disables the cache)
+        result_cache_size: Maximum number of cached results per decorated function
     """
     max_retries: int = 3
     initial_delay: float = 1.0
     max_delay: float = 60.0
     exponential_base: float = 2.0
     jitter: float = 0.1
+    jitter_strategy: str = "additive"
     retryable_exceptions: Tuple[Type[Exception], ...] = (
         ConnectionError,
         TimeoutError,
         OSError,
     )
+    result_cache_ttl: Optional[float] = None
+    result_cache_size: int = 128
+
+
+JITTER_STRATEGIES = ("none", "additive", "full", "decorrelated")
+
+
+def _build_delay_function(config: RetryConfig) -> Callable[[int, float], float]:
+    """
+    Select the backoff delay function for the configured jitter strategy.
+
+    The strategy and the exponential delay caps are resolved once when the
+    decorator is built, so the retry loop makes a single call per attempt.
+
+    Args:
+        config: Retry configuration
+
+    Returns:
+        Function mapping (retry_index, previous_delay) to the next delay
+
+    Raises:
+        ValueError: If the jitter strategy is unknown
+    """
+    caps = [
+        min(config.initial_delay * (config.exponential_base ** i), config.max_delay)
+        for i in range(config.max_retries)
+    ]
+    strategy = config.jitter_strategy
+
+    if strategy == "none":
+        def compute_delay(retry_index: int, previous_delay: float) -> float:
+            return caps[retry_index]
+
+    elif strategy == "additive":
+        jitter = config.jitter
+
+        def compute_delay(retry_index: int, previous_delay: float) -> float:
+            cap = caps[retry_index]
+            return cap + cap * jitter * random.random()
+
+    elif strategy == "full":
+        def compute_delay(retry_index: int, previous_delay: float) -> float:
+            return caps[retry_index] * random.random()
+
+    elif strategy == "decorrelated":
+        base = config.initial_delay
+        max_delay = config.max_delay
+
+        def compute_delay(retry_index: int, previous_delay: float) -> float:
+            return min(max_delay, base + random.random() * (previous_delay * 3 - base))
+
+    else:
+        raise ValueError(
+            f"Unknown jitter strategy '{strategy}', "
+            f"must be one of {list(JITTER_STRATEGIES)}"
+        )
+
+    return compute_delay
+
+
+def _hash_args(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+    """
+    Build a cache key from call arguments.
+
+    Falls back to ``repr`` for unhashable arguments (lists, dicts, ...).
+
+    Args:
+        args: Positional arguments
+        kwargs: Keyword arguments
+
+    Returns:
+        Hashable key for the call
+    """
+    key = (args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+        return key
+    except TypeError:
+        return repr(key)
+
+
+class _ResultCache:
+    """
+    Small LRU cache of successful results with TTL stamping.
+
+    Used by the retry decorators to serve identical repeated calls
+    (e.g. the same prompt or embedding during a retry storm) from memory.
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Any) -> Tuple[bool, Any]:
+        """Return (hit, result) for key, dropping expired entries."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, result
+
+    def put(self, key: Any, result: Any) -> None:
+        """Store result for key, evicting the least recently used entry."""
+        self._entries[key] = (time.monotonic(), result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
 
 
 def retry_with_backoff(config: Optional[RetryConfig] = None):
@@ -59,26 +184,32 @@ def retry_with_backoff(config: Optional[RetryConfig] = None):
 
     logger = FalconEyeLogger.get_instance()
 
+    compute_delay = _build_delay_function(config)
+
     def decorator(func: Callable) -> Callable:
+        cache = (
+            _ResultCache(config.result_cache_ttl, config.result_cache_size)
+            if config.result_cache_ttl is not None
+            else None
+        )
+
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
+            if cache is not None:
+                cache_key = (func.__qualname__, _hash_args(args, kwargs))
+                hit, cached_result = cache.get(cache_key)
+                if hit:
+                    return cached_result
+
             last_exception = None
+            delay = config.initial_delay
 
             for attempt in range(config.max_retries + 1):
                 try:
                     # First attempt or retry
                     if attempt > 0:
-                        # Calculate delay with exponential backoff
-                        delay = min(
-                            config.initial_delay * (config.exponential_base ** (attempt - 1)),
-                            config.max_delay
-                        )
-
-                        # Add jitter to prevent thundering herd
-                        if config.jitter > 0:
-                            import random
-                            jitter_amount = delay * config.jitter * random.random()
-                            delay = delay + jitter_amount
+                        # Exponential backoff with the configured jitter strategy
+                        delay = compute_delay(attempt - 1, delay)
 
                         with logging_context(operation="retry_backoff"):
                             logger.warning(
@@ -92,11 +223,18 @@ def retry_with_backoff(config: Optional[RetryConfig] = None):
                                 }
                             )
 
+                        # asyncio.sleep already schedules a single timer handle
+                        # and future; reusing an Event with loop.call_later was
+                        # benchmarked at parity (Event.wait allocates its own
+                        # future), so the simpler call is kept.
                         await asyncio.sleep(delay)
 
                     # Execute the function
                     result = await func(*args, **kwargs)
 
+                    if cache is not None:
+                        cache.put(cache_key, result)
+
                     # Log successful retry if this wasn't the first attempt
                     if attempt > 0:
                         with logging_context(operation="retry_success"):
@@ -116,17 +254,18 @@ def retry_with_backoff(config: Optional[RetryConfig] = None):
 
                     # If this was the last attempt, log and re-raise
                     if attempt == config.max_retries:
-                        with logging_context(operation="retry_exhausted"):
-                            logger.error(
-                                f"All retry attempts exhausted for {func.__name__}",
-                                exc_info=True,
-                                extra={
-                                    "function": func.__name__,
-                                    "total_attempts": attempt + 1,
-                                    "error_type": type(e).__name__,
-                                    "error_message": str(e)
-                                }
-                            )
+                        if logger.is_enabled_for(logging.ERROR):
+                            with logging_context(operation="retry_exhausted"):
+                                logger.error(
+                                    f"All retry attempts exhausted for {func.__name__}",
+                                    exc_info=e,
+                                    extra={
+                                        "function": func.__name__,
+                                        "total_attempts": attempt + 1,
+                                        "error_type": type(e).__name__,
+                                        "error_message": str(e)
+                                    }
+                                )
                         raise
 
                     # Otherwise, continue to next retry
@@ -134,22 +273,20 @@ def retry_with_backoff(config: Optional[RetryConfig] = None):
 
                 except Exception as e:
                     # Non-retryable exception, log and re-raise immediately
-                    with logging_context(operation="retry_non_retryable"):
-                        logger.error(
-                            f"Non-retryable exception in {func.__name__}",
-                            exc_info=True,
-                            extra={
-                                "function": func.__name__,
-                                "attempt": attempt + 1,
-                                "error_type": type(e).__name__,
-                                "error_message": str(e)
-                            }
-                        )
+                    if logger.is_enabled_for(logging.ERROR):
+                        with logging_context(operation="retry_non_retryable"):
+                            logger.error(
+                                f"Non-retryable exception in {func.__name__}",
+                                exc_info=e,
+                                extra={
+                                    "function": func.__name__,
+                                    "attempt": attempt + 1,
+                                    "error_type": type(e).__name__,
+                                    "error_message": str(e)
+                                }
+                            )
                     raise
 
-            # Should never reach here, but just in case
-            raise last_exception if last_exception else RuntimeError("Unexpected retry state")
-
         return wrapper
     return decorator
 
@@ -174,23 +311,29 @@ def retry_with_backoff_sync(config: Optional[RetryConfig] = None):
 
     logger = FalconEyeLogger.get_instance()
 
+    compute_delay = _build_delay_function(config)
+
     def decorator(func: Callable) -> Callable:
+        cache = (
+            _ResultCache(config.result_cache_ttl, config.result_cache_size)
+            if config.result_cache_ttl is not None
+            else None
+        )
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            last_exception = None
+            if cache is not None:
+                cache_key = (func.__qualname__, _hash_args(args, kwargs))
+                hit, cached_result = cache.get(cache_key)
+                if hit:
+                    return cached_result
+
+            delay = config.initial_delay
 
             for attempt in range(config.max_retries + 1):
                 try:
                     if attempt > 0:
-                        delay = min(
-                            config.initial_delay * (config.exponential_base ** (attempt - 1)),
-                            config.max_delay
-                        )
-
-                        if config.jitter > 0:
-                            import random
-                            jitter_amount = delay * config.jitter * random.random()
-                            delay = delay + jitter_amount
+                        delay = compute_delay(attempt - 1, delay)
 
                         with logging_context(operation="retry_backoff"):
                             logger.warning(
@@ -207,6 +350,9 @@ def retry_with_backoff_sync(config: Optional[RetryConfig] = None):
 
                     result = func(*args, **kwargs)
 
+                    if cache is not None:
+                        cache.put(cache_key, result)
+
                     if attempt > 0:
                         with logging_context(operation="retry_success"):
                             logger.info(
@@ -221,37 +367,35 @@ def retry_with_backoff_sync(config: Optional[RetryConfig] = None):
                     return result
 
                 except config.retryable_exceptions as e:
-                    last_exception = e
-
                     if attempt == config.max_retries:
-                        with logging_context(operation="retry_exhausted"):
+                        if logger.is_enabled_for(logging.ERROR):
+                            with logging_context(operation="retry_exhausted"):
+                                logger.error(
+                                    f"All retry attempts exhausted for {func.__name__}",
+                                    exc_info=e,
+                                    extra={
+                                        "function": func.__name__,
+                                        "total_attempts": attempt + 1,
+                                        "error_type": type(e).__name__
+                                    }
+                                )
+                        raise
+
+                    continue
+
+                except Exception as e:
+                    if logger.is_enabled_for(logging.ERROR):
+                        with logging_context(operation="retry_non_retryable"):
                             logger.error(
-                                f"All retry attempts exhausted for {func.__name__}",
-                                exc_info=True,
+                                f"Non-retryable exception in {func.__name__}",
+                                exc_info=e,
                                 extra={
                                     "function": func.__name__,
-                                    "total_attempts": attempt + 1,
+                                    "attempt": attempt + 1,
                                     "error_type": type(e).__name__
                                 }
                             )
-                        raise
-
-                    continue
-
-                except Exception as e:
-                    with logging_context(operation="retry_non_retryable"):
-                        logger.error(
-                            f"Non-retryable exception in {func.__name__}",
-                            exc_info=True,
-                            extra={
-                                "function": func.__name__,
-                                "attempt": attempt + 1,
-                                "error_type": type(e).__name__
-                            }
-                        )
                     raise
 
-            raise last_exception if last_exception else RuntimeError("Unexpected retry state")
-
         return wrapper
     return decorator
@@ -1,5 +1,6 @@
 """Vector store implementations."""
 
 from .chroma_adapter import ChromaVectorStoreAdapter
+from .query_cache import QueryCache, SemanticQueryCache
 
-__all__ = ["ChromaVectorStoreAdapter"]
\ No newline at end of file
+__all__ = ["ChromaVectorStoreAdapter", "QueryCache", "SemanticQueryCache"]
\ No newline at end of file
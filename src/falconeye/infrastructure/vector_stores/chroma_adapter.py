@@ -1,16 +1,36 @@
 """ChromaDB vector store adapter implementation."""
 
-import json
+import asyncio
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 import time
+import numpy as np
 import chromadb
+from chromadb.api import ClientAPI
 from chromadb.config import Settings
 
+from ...domain.exceptions import EmbeddingMismatchError
 from ...domain.repositories.vector_store_repository import VectorStoreRepository
 from ...domain.models.code_chunk import CodeChunk, ChunkMetadata
 from ...domain.models.document import DocumentChunk, DocumentMetadata
 from ..logging import FalconEyeLogger, logging_context
+from .metadata_codec import dumps_json, get_metadata_codec, loads_json
+from .query_cache import QueryCache, SemanticQueryCache, canonicalize_filters
+
+
+# Generated converters for code chunk metadata
+_encode_chunk_metadata, _decode_chunk_metadata = get_metadata_codec(ChunkMetadata)
+
+# Precomputed accessors for the document metadata conversion
+_DOC_META_GETTER = operator.attrgetter(
+    "file_path", "document_type", "title", "sections", "keywords",
+    "content_checksum", "project_id",
+)
+_DOC_CHUNK_GETTER = operator.attrgetter(
+    "start_char", "end_char", "chunk_index", "total_chunks",
+)
 
 
 class ChromaVectorStoreAdapter(VectorStoreRepository):
@@ -30,6 +50,21 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
         collection_prefix: str = "falconeye",
         project_id: Optional[str] = None,
         use_project_isolation: bool = True,
+        batch_size: int = 200,
+        query_cache_size: int = 256,
+        query_cache_ttl: float = 300.0,
+        semantic_cache_threshold: Optional[float] = None,
+        query_workers: int = 4,
+        prefer_post_filter: bool = False,
+        over_fetch: int = 4,
+        sqlite_tuning: bool = False,
+        ingest_mode: bool = False,
+        collection_names_ttl: float = 60.0,
+        hnsw_m: int = 32,
+        hnsw_construction_ef: int = 100,
+        hnsw_search_ef: int = 64,
+        embedding_signature: Optional[str] = None,
+        client: Optional[ClientAPI] = None,
     ):
         """
         Initialize ChromaDB adapter.
@@ -39,17 +74,59 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
             collection_prefix: Prefix for collection names
             project_id: Project identifier for isolated collections
             use_project_isolation: Whether to use project-scoped collections
+            batch_size: Maximum number of records per ChromaDB add() call
+            query_cache_size: Number of search results cached in memory (0 disables)
+            query_cache_ttl: Seconds before a cached search result expires
+            semantic_cache_threshold: Cosine similarity at which a near-duplicate
+                query embedding reuses cached results (None disables)
+            query_workers: Threads used to run ChromaDB queries off the event loop
+            prefer_post_filter: Apply simple search filters in Python on an
+                over-fetched result set instead of ChromaDB's where clause
+            over_fetch: Multiple of top_k to retrieve when post-filtering
+            sqlite_tuning: Apply WAL/cache/mmap PRAGMAs to ChromaDB's sqlite
+                backend (best effort, relies on Chroma internals)
+            ingest_mode: Additionally disable fsync and take an exclusive
+                lock for one-shot offline indexing (implies sqlite_tuning;
+                not crash-safe)
+            collection_names_ttl: Seconds before the cached list of collection
+                names is reloaded from ChromaDB
+            hnsw_m: HNSW graph degree (neighbors per node) for new collections
+            hnsw_construction_ef: HNSW candidate list size while building
+                new collections
+            hnsw_search_ef: HNSW candidate list size at query time for new
+                collections (Chroma's default of 10 trades recall for speed)
+            embedding_signature: Identifies the embedding endpoint, model and
+                dimension; stored on new collections and checked against
+                existing ones (None disables the check)
+            client: Existing ChromaDB client for persist_directory to share
+                (a new PersistentClient is created if None)
         """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
         self.persist_directory = Path(persist_directory)
         self.collection_prefix = collection_prefix
         self.project_id = project_id
         self.use_project_isolation = use_project_isolation
+        self.batch_size = batch_size
+
+        # HNSW index parameters, fixed when a collection is created
+        self._hnsw_metadata = {
+            "hnsw:M": hnsw_m,
+            "hnsw:construction_ef": hnsw_construction_ef,
+            "hnsw:search_ef": hnsw_search_ef,
+        }
+
+        # Embeddings from another endpoint, model or dimension are not
+        # comparable; collections record the setup they were indexed with
+        self.embedding_signature = embedding_signature
+        self._verified_collections: set = set()
 
         # Create directory if it doesn't exist
         self.persist_directory.mkdir(parents=True, exist_ok=True)
 
         # Initialize ChromaDB client
-        self.client = chromadb.PersistentClient(
+        self.client = client or chromadb.PersistentClient(
             path=str(self.persist_directory),
             settings=Settings(
                 anonymized_telemetry=False,
@@ -57,12 +134,124 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
             )
         )
 
-        # Cache for collections
-        self._collections: Dict[str, Any] = {}
-
         # Initialize logger
         self.logger = FalconEyeLogger.get_instance()
 
+        if sqlite_tuning or ingest_mode:
+            self._tune_sqlite(ingest_mode)
+
+        # Cache for collections and their project-scoped names
+        self._collections: Dict[str, Any] = {}
+        self._name_cache: Dict[tuple, str] = {}
+
+        # Single-slot cache for an immediately repeated embedding query:
+        # ((collection name, top_k, filters digest, embedding bytes), results)
+        self._last_query: Optional[tuple] = None
+
+        # Record counts per collection, used to choose a filtering strategy
+        self._count_cache: Dict[str, int] = {}
+        self.prefer_post_filter = prefer_post_filter
+        self.over_fetch = max(over_fetch, 1)
+
+        # Manifest of collection names in the database, loaded on first use,
+        # kept in sync with this adapter's creates and deletes, and reloaded
+        # after collection_names_ttl seconds to pick up other processes' changes
+        self.collection_names_ttl = collection_names_ttl
+        self._collection_names: Optional[frozenset] = None
+        self._collection_names_loaded_at = 0.0
+
+        # Cache for search results (invalidated on writes and deletes)
+        self._query_cache: Optional[QueryCache] = (
+            QueryCache(max_size=query_cache_size, ttl_seconds=query_cache_ttl)
+            if query_cache_size > 0
+            else None
+        )
+        self._semantic_cache: Optional[SemanticQueryCache] = (
+            SemanticQueryCache(threshold=semantic_cache_threshold, ttl_seconds=query_cache_ttl)
+            if semantic_cache_threshold is not None
+            else None
+        )
+
+        # ChromaDB queries are synchronous; run them on a bounded pool
+        self._executor = ThreadPoolExecutor(
+            max_workers=query_workers,
+            thread_name_prefix="falconeye-chroma",
+        )
+
+    def _tune_sqlite(self, ingest_mode: bool = False) -> bool:
+        """
+        Apply PRAGMA tuning to ChromaDB's sqlite metadata store.
+
+        ChromaDB does not expose its sqlite connection, so this reaches
+        into the client's internal component system. Any failure (e.g. a
+        Chroma version with a different backend) is logged and ignored.
+
+        Args:
+            ingest_mode: Also set synchronous=OFF and an exclusive lock
+
+        Returns:
+            True if the PRAGMAs were applied
+        """
+        pragmas = [
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            "PRAGMA temp_store=MEMORY",
+            "PRAGMA cache_size=-262144",
+            "PRAGMA mmap_size=268435456",
+        ]
+        if ingest_mode:
+            pragmas += [
+                "PRAGMA synchronous=OFF",
+                "PRAGMA locking_mode=EXCLUSIVE",
+            ]
+
+        try:
+            from chromadb.db.impl.sqlite import SqliteDB
+
+            conn = self.client._system.instance(SqliteDB)._conn_pool.connect()
+            for pragma in pragmas:
+                conn.execute(pragma)
+        except Exception as e:
+            self.logger.debug(
+                "SQLite PRAGMA tuning not applied",
+                extra={
+                    "error_type": type(e).__name__,
+                    "error": str(e),
+                }
+            )
+            return False
+
+        self.logger.debug(
+            "SQLite PRAGMA tuning applied",
+            extra={"ingest_mode": ingest_mode}
+        )
+        return True
+
+    def _name(self, collection: str) -> str:
+        """
+        Get the full ChromaDB collection name for a collection type.
+
+        Names are memoized per (project_id, collection) pair.
+
+        Args:
+            collection: Collection type (e.g., 'code', 'documents')
+
+        Returns:
+            Collection name with prefix and project isolation applied
+        """
+        key = (self.project_id, collection)
+        name = self._name_cache.get(key)
+        if name is None:
+            # Build collection name with project isolation
+            if self.use_project_isolation and self.project_id:
+                # Project-scoped: falconeye_{project_id}_{collection}
+                name = f"{self.collection_prefix}_{self.project_id}_{collection}"
+            else:
+                # Legacy/global: falconeye_{collection}
+                name = f"{self.collection_prefix}_{collection}"
+            self._name_cache[key] = name
+        return name
+
     def _get_collection(self, collection: str):
         """
         Get or create a collection with project isolation.
@@ -73,27 +262,170 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
         Returns:
             ChromaDB collection
         """
-        # Build collection name with project isolation
-        if self.use_project_isolation and self.project_id:
-            # Project-scoped: falconeye_{project_id}_{collection}
-            collection_name = f"{self.collection_prefix}_{self.project_id}_{collection}"
-        else:
-            # Legacy/global: falconeye_{collection}
-            collection_name = f"{self.collection_prefix}_{collection}"
+        collection_name = self._name(collection)
 
         if collection_name not in self._collections:
+            metadata = {
+                "description": f"FalconEYE {collection} collection",
+                "project_id": self.project_id or "global",
+                "collection_type": collection,
+            }
+            # HNSW parameters and the embedding signature can only be set at
+            # creation; existing collections keep the ones they were built with
+            if collection_name not in self._get_collection_names():
+                metadata.update(self._hnsw_metadata)
+                if self.embedding_signature:
+                    metadata["embedding_signature"] = self.embedding_signature
+                    self._verified_collections.add(collection_name)
+
             # Get or create collection
             self._collections[collection_name] = self.client.get_or_create_collection(
                 name=collection_name,
-                metadata={
-                    "description": f"FalconEYE {collection} collection",
-                    "project_id": self.project_id or "global",
-                    "collection_type": collection,
-                }
+                metadata=metadata,
             )
+            if self._collection_names is not None:
+                self._collection_names = self._collection_names | {collection_name}
 
+        self._verify_embedding_signature(collection_name, self._collections[collection_name])
         return self._collections[collection_name]
 
+    def _get_collection_readonly(self, collection: str, verify: bool = True):
+        """
+        Get an existing collection without creating it.
+
+        Used by read paths so that searching or counting a collection that
+        was never indexed does not create it (and its HNSW directory).
+
+        Args:
+            collection: Collection type (e.g., 'code', 'documents')
+            verify: Check the collection's embedding signature (counting
+                records does not compare vectors and skips it)
+
+        Returns:
+            ChromaDB collection, or None if it does not exist
+        """
+        collection_name = self._name(collection)
+
+        coll = self._collections.get(collection_name)
+        if coll is None:
+            try:
+                coll = self.client.get_collection(name=collection_name)
+            except Exception:
+                return None
+
+            self._collections[collection_name] = coll
+            if self._collection_names is not None:
+                self._collection_names = self._collection_names | {collection_name}
+
+        if verify:
+            self._verify_embedding_signature(collection_name, coll)
+        return coll
+
+    def _verify_embedding_signature(self, collection_name: str, coll) -> None:
+        """
+        Check that a collection was indexed with the current embedding setup.
+
+        Collections without a signature predate the /api/embed switch and
+        hold unnormalized vectors, so they are treated as mismatched too.
+
+        Args:
+            collection_name: Full collection name
+            coll: ChromaDB collection
+
+        Raises:
+            EmbeddingMismatchError: If the stored signature differs
+        """
+        if not self.embedding_signature or collection_name in self._verified_collections:
+            return
+
+        stored = (coll.metadata or {}).get("embedding_signature")
+        if stored != self.embedding_signature:
+            raise EmbeddingMismatchError(self._mismatch_message(collection_name, stored))
+        self._verified_collections.add(collection_name)
+
+    def _mismatch_message(self, collection_name: str, stored: Optional[str]) -> str:
+        """
+        Describe an embedding signature mismatch and how to resolve it.
+
+        Args:
+            collection_name: Full collection name
+            stored: Signature recorded on the collection, or None
+
+        Returns:
+            Error message naming the collection and the re-index command
+        """
+        return (
+            f"Collection '{collection_name}' was indexed with "
+            f"'{stored or 'an older FalconEYE embedding setup'}', but the current "
+            f"configuration produces '{self.embedding_signature}'. "
+            f"Rebuild it with `falconeye index <path> --force-reindex`."
+        )
+
+    async def check_embedding_compatibility(self, collection: str) -> None:
+        """
+        Verify that a collection's embeddings match the current embedding setup.
+
+        Collections that do not exist yet are compatible.
+
+        Args:
+            collection: Collection type (e.g., 'code', 'documents')
+
+        Raises:
+            EmbeddingMismatchError: If the collection was indexed with a
+                different embedding endpoint, model or dimension, or
+                predates embedding signatures
+        """
+        self._get_collection_readonly(collection)
+
+    async def ensure_embedding_compatibility(
+        self,
+        collection: str,
+        rebuild: bool = False,
+    ) -> bool:
+        """
+        Prepare a collection for indexing with the current embedding setup.
+
+        Collections that do not exist yet are compatible. Collections without
+        a signature predate it and cannot be searched with new embeddings, so
+        they are always rebuilt; mismatched ones only when rebuild is set.
+        Only the named collection is dropped.
+
+        Args:
+            collection: Collection type (e.g., 'code', 'documents')
+            rebuild: Rebuild a mismatched collection instead of raising
+
+        Returns:
+            True if the collection was rebuilt and must be re-indexed
+
+        Raises:
+            EmbeddingMismatchError: If the collection was indexed with a
+                different embedding endpoint, model or dimension and
+                rebuild is not set
+        """
+        coll = self._get_collection_readonly(collection, verify=False)
+        if coll is None or not self.embedding_signature:
+            return False
+
+        collection_name = self._name(collection)
+        stored = (coll.metadata or {}).get("embedding_signature")
+        if stored == self.embedding_signature:
+            self._verified_collections.add(collection_name)
+            return False
+        if stored is not None and not rebuild:
+            raise EmbeddingMismatchError(self._mismatch_message(collection_name, stored))
+
+        self.logger.warning(
+            "Rebuilding collection indexed with a different embedding setup",
+            extra={
+                "collection": collection_name,
+                "stored_signature": stored,
+                "embedding_signature": self.embedding_signature,
+            }
+        )
+        await self.delete_collection(collection)
+        self._get_collection(collection)
+        return True
+
     async def store_chunks(
         self,
         chunks: List[CodeChunk],
@@ -125,23 +457,33 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
             try:
                 coll = self._get_collection(collection)
 
-                # Prepare data for ChromaDB
-                ids = [str(chunk.id) for chunk in chunks]
-                embeddings = [chunk.embedding for chunk in chunks]
-                documents = [chunk.content for chunk in chunks]
-                metadatas = [self._chunk_metadata_to_dict(chunk.metadata) for chunk in chunks]
-
-                # Validate embeddings
-                if any(emb is None for emb in embeddings):
+                # Validate embeddings before writing anything
+                if any(chunk.embedding is None for chunk in chunks):
                     raise ValueError("All chunks must have embeddings")
 
-                # Store in ChromaDB
-                coll.add(
-                    ids=ids,
-                    embeddings=embeddings,
-                    documents=documents,
-                    metadatas=metadatas,
-                )
+                # Prepare data for ChromaDB in a single pass, flushing
+                # size-capped sub-batches to bound memory per add() call
+                ids, embeddings, documents, metadatas = [], [], [], []
+                for chunk in chunks:
+                    ids.append(str(chunk.id))
+                    embeddings.append(chunk.embedding)
+                    documents.append(chunk.content)
+                    metadata = self._chunk_metadata_to_dict(chunk.metadata)
+                    metadata["token_count"] = chunk.token_count
+                    metadatas.append(metadata)
+
+                    if len(ids) >= self.batch_size:
+                        await self._add_batch_async(
+                            coll, ids, embeddings, documents, metadatas
+                        )
+                        ids, embeddings, documents, metadatas = [], [], [], []
+
+                if ids:
+                    await self._add_batch_async(
+                        coll, ids, embeddings, documents, metadatas
+                    )
+
+                self._invalidate_query_cache(collection)
 
                 duration = time.time() - start_time
                 self.logger.info(
@@ -206,42 +548,74 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
             )
 
             try:
-                coll = self._get_collection(collection)
+                # Canonicalize once for both the cache keys and the where clause
+                where, filters_digest = self._canon_filters(filters)
+
+                cache_key = None
+
+                last_key = None
+                if query_embedding:
+                    last_key = self._last_query_key(collection, top_k, filters_digest, query_embedding)
+                    cached = self._last_query_get(last_key)
+                    if cached is not None:
+                        return cached
+
+                if self._query_cache is not None:
+                    cache_key = QueryCache.make_key(
+                        self._name(collection), top_k, None,
+                        embedding=query_embedding or None,
+                        query=query,
+                        filters_digest=filters_digest,
+                    )
+                    cached = self._query_cache.get(cache_key)
+                    if cached is not None:
+                        self.logger.debug(
+                            "Vector search served from cache",
+                            extra={
+                                "results_found": len(cached),
+                                "collection": collection
+                            }
+                        )
+                        return cached
+
+                if query_embedding:
+                    cached = self._semantic_cache_get(collection, top_k, filters_digest, query_embedding)
+                    if cached is not None:
+                        if cache_key is not None:
+                            self._query_cache.put(cache_key, cached)
+                        return cached
 
-                # Build where clause if filters provided
-                where = None
-                if filters:
-                    where = filters
+                coll = self._get_collection_readonly(collection)
+                if coll is None:
+                    # Nothing has been indexed into this collection yet
+                    return []
 
                 # Use embedding search if provided, otherwise use text query
                 # Note: Text query uses ChromaDB's default embedding which may have different dimensions
                 if query_embedding:
-                    results = coll.query(
-                        query_embeddings=[query_embedding],
-                        n_results=top_k,
-                        where=where,
+                    results = await self._filtered_query(
+                        coll, collection, top_k, where,
+                        query_embeddings=self._to_embedding_matrix([query_embedding]),
+                        include=self._search_include(),
                     )
                 else:
                     # This path uses ChromaDB's built-in embedding
                     # For consistency, always provide query_embedding
-                    results = coll.query(
+                    results = await self._filtered_query(
+                        coll, collection, top_k, where,
                         query_texts=[query],
-                        n_results=top_k,
-                        where=where,
+                        include=self._search_include(),
                     )
 
                 # Convert results to CodeChunk objects
-                chunks = []
-                if results["ids"] and results["ids"][0]:
-                    for i, chunk_id in enumerate(results["ids"][0]):
-                        metadata = self._dict_to_chunk_metadata(results["metadatas"][0][i])
-                        chunk = CodeChunk.create(
-                            content=results["documents"][0][i],
-                            metadata=metadata,
-                            token_count=len(results["documents"][0][i]) // 4,  # Rough estimate
-                            embedding=results["embeddings"][0][i] if results.get("embeddings") else None,
-                        )
-                        chunks.append(chunk)
+                chunks = self._results_to_chunks(results)
+
+                if cache_key is not None:
+                    self._query_cache.put(cache_key, chunks)
+                if last_key is not None:
+                    self._last_query = (last_key, list(chunks))
+                if query_embedding:
+                    self._semantic_cache_put(collection, top_k, filters_digest, query_embedding, chunks)
 
                 duration = time.time() - start_time
                 self.logger.info(
@@ -309,29 +683,236 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
         Returns:
             List of similar code chunks
         """
-        coll = self._get_collection(collection)
+        cache_key = None
+
+        last_key = self._last_query_key(collection, top_k, "", embedding)
+        cached = self._last_query_get(last_key)
+        if cached is not None:
+            return cached
+
+        if self._query_cache is not None:
+            cache_key = QueryCache.make_key(self._name(collection), top_k, None, embedding=embedding)
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        cached = self._semantic_cache_get(collection, top_k, "", embedding)
+        if cached is not None:
+            if cache_key is not None:
+                self._query_cache.put(cache_key, cached)
+            return cached
+
+        coll = self._get_collection_readonly(collection)
+        if coll is None:
+            return []
 
         # Query ChromaDB with embedding
-        results = coll.query(
-            query_embeddings=[embedding],
+        results = await self._query(
+            coll,
+            query_embeddings=self._to_embedding_matrix([embedding]),
             n_results=top_k,
+            include=self._search_include(),
         )
 
         # Convert results to CodeChunk objects
-        chunks = []
-        if results["ids"] and results["ids"][0]:
-            for i, chunk_id in enumerate(results["ids"][0]):
-                metadata = self._dict_to_chunk_metadata(results["metadatas"][0][i])
-                chunk = CodeChunk.create(
-                    content=results["documents"][0][i],
-                    metadata=metadata,
-                    token_count=len(results["documents"][0][i]) // 4,
-                    embedding=results["embeddings"][0][i] if results.get("embeddings") else None,
-                )
-                chunks.append(chunk)
+        chunks = self._results_to_chunks(results)
+
+        if cache_key is not None:
+            self._query_cache.put(cache_key, chunks)
+        self._last_query = (last_key, list(chunks))
+        self._semantic_cache_put(collection, top_k, "", embedding, chunks)
 
         return chunks
 
+    async def _filtered_query(
+        self,
+        coll,
+        collection: str,
+        top_k: int,
+        where: Optional[dict],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Run a single query, choosing between a where clause and post-filtering.
+
+        ChromaDB's metadata filtering is slow on large collections. Simple
+        filters are applied in Python on an over-fetched result set when the
+        adapter prefers it (prefer_post_filter), or when the collection is small enough that the
+        over-fetch covers all of it. If post-filtering leaves fewer than
+        top_k matches, the query is repeated with the where clause.
+
+        Args:
+            coll: ChromaDB collection
+            collection: Collection type (for the cached count)
+            top_k: Number of results
+            where: Canonical metadata filters, or None
+            **kwargs: Query embeddings/texts and include for collection.query()
+
+        Returns:
+            Raw ChromaDB query results for one query
+        """
+        if where is None or not self._can_post_filter(where):
+            return await self._query(coll, n_results=top_k, where=where, **kwargs)
+
+        fetch = top_k * self.over_fetch
+        if not self.prefer_post_filter and self._collection_count(collection, coll) > fetch:
+            return await self._query(coll, n_results=top_k, where=where, **kwargs)
+
+        results = await self._query(coll, n_results=fetch, **kwargs)
+
+        metadatas = results["metadatas"][0] if results["metadatas"] else []
+        keep = [
+            i for i, metadata in enumerate(metadatas)
+            if self._matches_filters(metadata, where)
+        ]
+        if len(keep) < top_k and len(metadatas) == fetch:
+            # The over-fetch did not yield enough matches; let ChromaDB filter
+            return await self._query(coll, n_results=top_k, where=where, **kwargs)
+
+        keep = keep[:top_k]
+        filtered: Dict[str, Any] = {}
+        for field in ("ids", "documents", "metadatas", "embeddings", "distances"):
+            values = results.get(field)
+            filtered[field] = (
+                [[values[0][i] for i in keep]] if values is not None else None
+            )
+        return filtered
+
+    def _collection_count(self, collection: str, coll) -> int:
+        """
+        Get a collection's record count, cached until the next write.
+
+        Args:
+            collection: Collection type
+            coll: ChromaDB collection
+
+        Returns:
+            Number of records in the collection
+        """
+        collection_name = self._name(collection)
+        count = self._count_cache.get(collection_name)
+        if count is None:
+            count = coll.count()
+            self._count_cache[collection_name] = count
+        return count
+
+    # Filter operators that _matches_filters() evaluates in Python
+    _POST_FILTER_OPERATORS = ("$eq", "$ne", "$in", "$nin")
+
+    @classmethod
+    def _can_post_filter(cls, where: dict) -> bool:
+        """
+        Check whether filters only use operators supported by post-filtering.
+
+        Args:
+            where: Canonical metadata filters
+
+        Returns:
+            True if _matches_filters() can evaluate the filters
+        """
+        for key, condition in where.items():
+            if key == "$and":
+                if not all(cls._can_post_filter(clause) for clause in condition):
+                    return False
+            elif key.startswith("$"):
+                return False
+            elif isinstance(condition, dict):
+                if not condition or any(
+                    op not in cls._POST_FILTER_OPERATORS for op in condition
+                ):
+                    return False
+        return True
+
+    @classmethod
+    def _matches_filters(cls, metadata: Dict[str, Any], where: dict) -> bool:
+        """
+        Evaluate post-filterable metadata filters against one record.
+
+        Args:
+            metadata: Record metadata from ChromaDB
+            where: Filters accepted by _can_post_filter()
+
+        Returns:
+            True if the record matches every condition
+        """
+        for key, condition in where.items():
+            if key == "$and":
+                if not all(cls._matches_filters(metadata, clause) for clause in condition):
+                    return False
+                continue
+
+            value = metadata.get(key) if metadata else None
+            if not isinstance(condition, dict):
+                condition = {"$eq": condition}
+
+            for op, operand in condition.items():
+                if op == "$eq" and value != operand:
+                    return False
+                if op == "$ne" and value == operand:
+                    return False
+                if op == "$in" and value not in operand:
+                    return False
+                if op == "$nin" and value in operand:
+                    return False
+        return True
+
+    async def _query(self, coll, **kwargs) -> Dict[str, Any]:
+        """
+        Run a ChromaDB query on the adapter's thread pool.
+
+        Args:
+            coll: ChromaDB collection
+            **kwargs: Arguments for collection.query()
+
+        Returns:
+            Raw ChromaDB query results
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            lambda: coll.query(**kwargs)
+        )
+
+    @staticmethod
+    def _search_include() -> List[str]:
+        """
+        Get the result fields to request from ChromaDB.
+
+        Stored embeddings are never fetched; context assembly uses content
+        and metadata only.
+
+        Returns:
+            Value for the query include parameter
+        """
+        return ["documents", "metadatas"]
+
+    def _results_to_chunks(self, results: Dict[str, Any]) -> List[CodeChunk]:
+        """
+        Convert single-query ChromaDB results to CodeChunk objects.
+
+        Args:
+            results: Raw ChromaDB query results
+
+        Returns:
+            List of code chunks
+        """
+        if not results["ids"] or not results["ids"][0]:
+            return []
+
+        metadatas = results["metadatas"][0]
+        embeddings = results.get("embeddings")
+        return CodeChunk.from_search_rows(
+            results["documents"][0],
+            list(map(self._dict_to_chunk_metadata, metadatas)),
+            (
+                [np.asarray(e).tolist() for e in embeddings[0]]
+                if embeddings is not None
+                else None
+            ),
+            # Stored at index time; absent in older indexes
+            [metadata.get("token_count") for metadata in metadatas],
+        )
+
     async def delete_collection(self, collection: str) -> None:
         """
         Delete an entire collection.
@@ -339,20 +920,22 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
         Args:
             collection: Collection type to delete
         """
-        # Build collection name with project isolation
-        if self.use_project_isolation and self.project_id:
-            collection_name = f"{self.collection_prefix}_{self.project_id}_{collection}"
-        else:
-            collection_name = f"{self.collection_prefix}_{collection}"
+        collection_name = self._name(collection)
+
+        self._invalidate_query_cache(collection)
 
         try:
             self.client.delete_collection(name=collection_name)
             if collection_name in self._collections:
                 del self._collections[collection_name]
+            self._verified_collections.discard(collection_name)
         except Exception:
             # Collection might not exist
             pass
 
+        if self._collection_names is not None:
+            self._collection_names = self._collection_names - {collection_name}
+
     async def collection_exists(self, collection: str) -> bool:
         """
         Check if collection exists.
@@ -363,15 +946,14 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
         Returns:
             True if collection exists
         """
-        # Build collection name with project isolation
-        if self.use_project_isolation and self.project_id:
-            collection_name = f"{self.collection_prefix}_{self.project_id}_{collection}"
-        else:
-            collection_name = f"{self.collection_prefix}_{collection}"
+        collection_name = self._name(collection)
+
+        # Collections opened by this adapter are known to exist
+        if collection_name in self._collections:
+            return True
 
         try:
-            collections = self.client.list_collections()
-            return any(c.name == collection_name for c in collections)
+            return collection_name in self._get_collection_names()
         except Exception:
             return False
 
@@ -385,11 +967,8 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
         Returns:
             Number of chunks
         """
-        if not await self.collection_exists(collection):
-            return 0
-
-        coll = self._get_collection(collection)
-        return coll.count()
+        coll = self._get_collection_readonly(collection, verify=False)
+        return coll.count() if coll is not None else 0
 
     async def delete_project_collections(self) -> None:
         """
@@ -404,6 +983,107 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
         for collection_type in ["code", "documents", "metadata"]:
             await self.delete_collection(collection_type)
 
+        self._invalidate_query_cache()
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """
+        Get search result cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, evictions and size (empty if disabled)
+        """
+        stats: Dict[str, int] = {}
+        if self._query_cache is not None:
+            stats.update(self._query_cache.get_stats())
+        if self._semantic_cache is not None:
+            for key, value in self._semantic_cache.get_stats().items():
+                stats[f"semantic_{key}"] = value
+        return stats
+
+    def _invalidate_query_cache(self, collection: Optional[str] = None) -> None:
+        """
+        Drop cached search results after the underlying data changed.
+
+        Args:
+            collection: Collection type to invalidate (all if None)
+        """
+        collection_name = self._name(collection) if collection is not None else None
+        if self._last_query is not None and collection_name in (None, self._last_query[0][0]):
+            self._last_query = None
+        if collection_name is None:
+            self._count_cache.clear()
+        else:
+            self._count_cache.pop(collection_name, None)
+        if self._query_cache is not None:
+            self._query_cache.invalidate(collection_name)
+        if self._semantic_cache is not None:
+            self._semantic_cache.invalidate(collection_name)
+
+    def _last_query_key(
+        self,
+        collection: str,
+        top_k: int,
+        filters_digest: str,
+        embedding: List[float],
+    ) -> tuple:
+        """Build the single-slot cache key for an embedding query."""
+        return (
+            self._name(collection),
+            top_k,
+            filters_digest,
+            np.asarray(embedding, dtype=np.float32).tobytes(),
+        )
+
+    def _last_query_get(self, key: tuple) -> Optional[List[CodeChunk]]:
+        """Return the previous query's results if it had the same key."""
+        last = self._last_query
+        if last is not None and last[0] == key:
+            return list(last[1])
+        return None
+
+    @staticmethod
+    def _canon_filters(filters: Optional[dict]) -> tuple:
+        """
+        Canonicalize metadata filters once per search.
+
+        Args:
+            filters: Caller-supplied metadata filters
+
+        Returns:
+            Tuple of (where clause for ChromaDB or None, filters digest)
+        """
+        return canonicalize_filters(filters)
+
+    def _semantic_cache_get(
+        self,
+        collection: str,
+        top_k: int,
+        filters_digest: str,
+        embedding: List[float],
+    ) -> Optional[List[CodeChunk]]:
+        """Look up a near-duplicate query in the semantic cache, if enabled."""
+        if self._semantic_cache is None:
+            return None
+        namespace = (self._name(collection), top_k, filters_digest)
+        return self._semantic_cache.get(namespace, embedding)
+
+    def _semantic_cache_put(
+        self,
+        collection: str,
+        top_k: int,
+        filters_digest: str,
+        embedding: List[float],
+        chunks: List[CodeChunk],
+    ) -> None:
+        """Store search results in the semantic cache, if enabled."""
+        if self._semantic_cache is None:
+            return
+        namespace = (self._name(collection), top_k, filters_digest)
+        signature = tuple(
+            (chunk.metadata.file_path, chunk.metadata.chunk_index) for chunk in chunks
+        )
+        self._semantic_cache.put(namespace, embedding, chunks, signature)
+
     def list_all_project_collections(self) -> List[str]:
         """
         List all project-scoped collections in the database.
@@ -412,16 +1092,131 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
             List of collection names
         """
         try:
-            collections = self.client.list_collections()
-            return [c.name for c in collections]
+            prefix = f"{self.collection_prefix}_"
+            return [
+                name for name in self._get_collection_names()
+                if name.startswith(prefix)
+            ]
         except Exception:
             return []
 
+    def _get_collection_names(self) -> frozenset:
+        """
+        Get the manifest of collection names, loading it when stale.
+
+        Returns:
+            Set of collection names in the database
+        """
+        if (
+            self._collection_names is None
+            or time.monotonic() - self._collection_names_loaded_at > self.collection_names_ttl
+        ):
+            self._refresh_collections()
+        return self._collection_names
+
+    def _refresh_collections(self) -> None:
+        """
+        Reload the manifest of collection names from ChromaDB.
+        """
+        # Chroma versions differ in whether list_collections() returns
+        # collection objects or plain names
+        self._collection_names = frozenset(
+            getattr(c, "name", c) for c in self.client.list_collections()
+        )
+        self._collection_names_loaded_at = time.monotonic()
+
+    async def _add_batch_async(
+        self,
+        coll,
+        ids: List[str],
+        embeddings: List[List[float]],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Write one sub-batch on the adapter's thread pool and wait for it.
+
+        Args:
+            coll: ChromaDB collection
+            ids: Record IDs
+            embeddings: Embedding vectors
+            documents: Record contents
+            metadatas: Flat metadata dictionaries
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self._executor,
+            self._add_batch,
+            coll,
+            ids,
+            embeddings,
+            documents,
+            metadatas,
+        )
+
+    def _add_batch(
+        self,
+        coll,
+        ids: List[str],
+        embeddings: List[List[float]],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Write one sub-batch to a ChromaDB collection.
+
+        Args:
+            coll: ChromaDB collection
+            ids: Record IDs
+            embeddings: Embedding vectors
+            documents: Record contents
+            metadatas: Flat metadata dictionaries
+        """
+        coll.add(
+            ids=ids,
+            embeddings=self._to_embedding_matrix(embeddings),
+            documents=documents,
+            metadatas=metadatas,
+        )
+
+    @staticmethod
+    def _to_embedding_matrix(embeddings: List[List[float]]) -> np.ndarray:
+        """
+        Convert embeddings to a contiguous float32 matrix for ChromaDB.
+
+        ChromaDB accepts ndarrays directly, which avoids converting
+        Python float lists element by element on every add/query.
+
+        Args:
+            embeddings: Embedding vectors of equal dimension
+
+        Returns:
+            Array of shape (len(embeddings), dimension)
+
+        Raises:
+            ValueError: If embeddings are ragged or contain NaN values
+        """
+        try:
+            matrix = np.asarray(embeddings, dtype=np.float32)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Embeddings must be numeric vectors of equal length: {e}") from e
+
+        if matrix.ndim != 2 or matrix.shape[1] == 0:
+            raise ValueError(
+                f"Embeddings must be non-empty vectors of equal length, got shape {matrix.shape}"
+            )
+        if np.isnan(matrix).any():
+            raise ValueError("Embeddings must not contain NaN values")
+
+        return matrix
+
     def _chunk_metadata_to_dict(self, metadata: ChunkMetadata) -> Dict[str, Any]:
         """
         Convert ChunkMetadata to dictionary for ChromaDB.
 
-        ChromaDB requires flat dictionaries with string values.
+        ChromaDB requires flat dictionaries. Ints and bools are stored as
+        native metadata types so they can be used in indexed `where`
+        filters; lists are JSON-encoded.
 
         Args:
             metadata: ChunkMetadata object
@@ -429,39 +1224,22 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
         Returns:
             Dictionary representation
         """
-        return {
-            "file_path": metadata.file_path,
-            "language": metadata.language,
-            "start_line": str(metadata.start_line),
-            "end_line": str(metadata.end_line),
-            "chunk_index": str(metadata.chunk_index),
-            "total_chunks": str(metadata.total_chunks),
-            "has_functions": str(metadata.has_functions),
-            "has_imports": str(metadata.has_imports),
-            "function_names": json.dumps(metadata.function_names),
-        }
+        return _encode_chunk_metadata(metadata)
 
     def _dict_to_chunk_metadata(self, data: Dict[str, Any]) -> ChunkMetadata:
         """
         Convert dictionary to ChunkMetadata.
 
+        Accepts both native values and the string-encoded values written
+        by older indexes.
+
         Args:
             data: Dictionary from ChromaDB
 
         Returns:
             ChunkMetadata object
         """
-        return ChunkMetadata(
-            file_path=data["file_path"],
-            language=data["language"],
-            start_line=int(data["start_line"]),
-            end_line=int(data["end_line"]),
-            chunk_index=int(data["chunk_index"]),
-            total_chunks=int(data["total_chunks"]),
-            has_functions=data["has_functions"] == "True",
-            has_imports=data["has_imports"] == "True",
-            function_names=json.loads(data.get("function_names", "[]")),
-        )
+        return _decode_chunk_metadata(data)
 
     async def store_document_chunks(
         self,
@@ -480,23 +1258,134 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
 
         coll = self._get_collection(collection)
 
-        # Prepare data for ChromaDB
-        ids = [chunk.chunk_id for chunk in chunks]
-        embeddings = [chunk.embedding for chunk in chunks]
-        documents = [chunk.content for chunk in chunks]
-        metadatas = [self._doc_metadata_to_dict(chunk) for chunk in chunks]
-
-        # Validate embeddings
-        if any(emb is None for emb in embeddings):
+        # Validate embeddings before writing anything
+        if any(chunk.embedding is None for chunk in chunks):
             raise ValueError("All document chunks must have embeddings")
 
-        # Store in ChromaDB
-        coll.add(
-            ids=ids,
-            embeddings=embeddings,
-            documents=documents,
-            metadatas=metadatas,
+        # Prepare data for ChromaDB in size-capped sub-batches
+        ids, embeddings, documents, metadatas = [], [], [], []
+        for chunk in chunks:
+            ids.append(chunk.chunk_id)
+            embeddings.append(chunk.embedding)
+            documents.append(chunk.content)
+            metadatas.append(self._doc_metadata_to_dict(chunk))
+
+            if len(ids) >= self.batch_size:
+                await self._add_batch_async(coll, ids, embeddings, documents, metadatas)
+                ids, embeddings, documents, metadatas = [], [], [], []
+
+        if ids:
+            await self._add_batch_async(coll, ids, embeddings, documents, metadatas)
+
+        self._invalidate_query_cache(collection)
+
+    async def get_document_checksums(
+        self,
+        project_id: str,
+        collection: str = "documents"
+    ) -> Dict[str, str]:
+        """
+        Get the content checksum of every document stored for a project.
+
+        The documents collection is shared by all projects, so results are
+        filtered on the project_id stored with each chunk. Documents
+        indexed before checksums were recorded map to an empty string, so
+        they never match and get re-indexed once.
+
+        Args:
+            project_id: Project the documents were indexed for
+            collection: Collection name (defaults to "documents")
+
+        Returns:
+            Dictionary mapping document file path to content checksum
+        """
+        coll = self._get_collection_readonly(collection)
+        if coll is None:
+            return {}
+
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(
+            self._executor,
+            lambda: coll.get(
+                where={"project_id": project_id},
+                include=["metadatas"]
+            )
+        )
+
+        return {
+            metadata["file_path"]: metadata.get("content_checksum") or ""
+            for metadata in results["metadatas"] or []
+        }
+
+    async def get_document_chunk_embeddings(
+        self,
+        file_path: str,
+        project_id: str,
+        collection: str = "documents"
+    ) -> Dict[str, List[float]]:
+        """
+        Get the stored embeddings of a project's document chunks.
+
+        Keyed by chunk text, so a re-indexed document can reuse the vector
+        of every chunk whose content did not change.
+
+        Args:
+            file_path: Document path as stored in chunk metadata
+            project_id: Project the document was indexed for
+            collection: Collection name (defaults to "documents")
+
+        Returns:
+            Dictionary mapping chunk text to its embedding
+        """
+        coll = self._get_collection_readonly(collection)
+        if coll is None:
+            return {}
+
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(
+            self._executor,
+            lambda: coll.get(
+                where=self._document_filter(file_path, project_id),
+                include=["documents", "embeddings"]
+            )
+        )
+
+        documents = results.get("documents")
+        embeddings = results.get("embeddings")
+        if documents is None or embeddings is None:
+            return {}
+
+        return {
+            text: [float(x) for x in embedding]
+            for text, embedding in zip(documents, embeddings)
+        }
+
+    async def delete_document_chunks(
+        self,
+        file_path: str,
+        project_id: str,
+        collection: str = "documents"
+    ) -> None:
+        """
+        Delete all stored chunks of a project's document.
+
+        Documents with the same relative path in other projects are kept.
+
+        Args:
+            file_path: Document path as stored in chunk metadata
+            project_id: Project the document was indexed for
+            collection: Collection name (defaults to "documents")
+        """
+        coll = self._get_collection_readonly(collection)
+        if coll is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self._executor,
+            lambda: coll.delete(where=self._document_filter(file_path, project_id))
         )
+        self._invalidate_query_cache(collection)
 
     async def search_similar_documents(
         self,
@@ -518,18 +1407,24 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
             List of similar document chunks
         """
         try:
-            coll = self._get_collection(collection)
+            coll = self._get_collection_readonly(collection)
+            if coll is None:
+                return []
 
             # Use embedding search if provided
             if query_embedding:
-                results = coll.query(
-                    query_embeddings=[query_embedding],
+                results = await self._query(
+                    coll,
+                    query_embeddings=self._to_embedding_matrix([query_embedding]),
                     n_results=top_k,
+                    include=self._search_include(),
                 )
             else:
-                results = coll.query(
+                results = await self._query(
+                    coll,
                     query_texts=[query],
                     n_results=top_k,
+                    include=self._search_include(),
                 )
 
             # Convert results to DocumentChunk objects
@@ -540,7 +1435,7 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
                         chunk_id=chunk_id,
                         content=results["documents"][0][i],
                         metadata_dict=results["metadatas"][0][i],
-                        embedding=results["embeddings"][0][i] if results.get("embeddings") else None,
+                        embedding=None,
                     )
                     chunks.append(chunk)
 
@@ -570,6 +1465,20 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
                 ) from e
             raise
 
+    @staticmethod
+    def _document_filter(file_path: str, project_id: str) -> Dict[str, Any]:
+        """
+        Build the ChromaDB filter selecting one project's document.
+
+        Args:
+            file_path: Document path as stored in chunk metadata
+            project_id: Project the document was indexed for
+
+        Returns:
+            ChromaDB where clause
+        """
+        return {"$and": [{"file_path": file_path}, {"project_id": project_id}]}
+
     def _doc_metadata_to_dict(self, chunk: DocumentChunk) -> Dict[str, Any]:
         """
         Convert DocumentChunk metadata to dictionary for ChromaDB.
@@ -580,16 +1489,22 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
         Returns:
             Dictionary representation
         """
+        fp, doc_type, title, sections, keywords, checksum, project_id = (
+            _DOC_META_GETTER(chunk.metadata)
+        )
+        sc, ec, ci, tc = _DOC_CHUNK_GETTER(chunk)
         return {
-            "file_path": chunk.metadata.file_path,
-            "document_type": chunk.metadata.document_type,
-            "title": chunk.metadata.title or "",
-            "sections": json.dumps(chunk.metadata.sections),
-            "keywords": json.dumps(chunk.metadata.keywords),
-            "start_char": str(chunk.start_char),
-            "end_char": str(chunk.end_char),
-            "chunk_index": str(chunk.chunk_index),
-            "total_chunks": str(chunk.total_chunks),
+            "file_path": fp,
+            "document_type": doc_type,
+            "title": title or "",
+            "sections": dumps_json(sections),
+            "keywords": dumps_json(keywords),
+            "content_checksum": checksum or "",
+            "project_id": project_id or "",
+            "start_char": sc,
+            "end_char": ec,
+            "chunk_index": ci,
+            "total_chunks": tc,
         }
 
     def _dict_to_document_chunk(
@@ -602,6 +1517,8 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
         """
         Convert dictionary to DocumentChunk.
 
+        Integer fields may be native ints or strings written by older indexes.
+
         Args:
             chunk_id: Chunk ID
             content: Chunk content
@@ -617,8 +1534,10 @@ class ChromaVectorStoreAdapter(VectorStoreRepository):
             file_path=metadata_dict["file_path"],
             document_type=metadata_dict["document_type"],
             title=metadata_dict.get("title") or None,
-            sections=json.loads(metadata_dict.get("sections", "[]")),
-            keywords=json.loads(metadata_dict.get("keywords", "[]")),
+            sections=loads_json(metadata_dict.get("sections", "[]")),
+            keywords=loads_json(metadata_dict.get("keywords", "[]")),
+            content_checksum=metadata_dict.get("content_checksum") or None,
+            project_id=metadata_dict.get("project_id") or None,
         )
 
         return DocumentChunk(
@@ -0,0 +1,102 @@
+"""
+Generated converters between metadata dataclasses and ChromaDB metadata.
+
+ChromaDB metadata must be a flat dictionary of scalars. The converters for
+a dataclass are generated once from its fields, so the per-chunk ingest
+and search paths run straight-line code with every field access inlined.
+"""
+
+import dataclasses
+import json
+import typing
+from typing import Any, Callable, Dict, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional speedup (pip install falconeye[speedups])
+    orjson = None
+
+
+if orjson is not None:
+    def dumps_json(value: Any) -> str:
+        """Encode a value as compact JSON text."""
+        return orjson.dumps(value).decode("utf-8")
+
+    loads_json = orjson.loads
+else:
+    dumps_json = json.JSONEncoder(separators=(",", ":")).encode
+    loads_json = json.loads
+
+
+# ChromaDB metadata values: str, int, float and bool are stored natively,
+# anything else (lists) is stored as compact JSON
+_NATIVE_TYPES = (str, int, float, bool)
+
+# Values older indexes wrote for booleans before native types were used
+_TRUE_VALUES = (True, "True")
+
+MetadataCodec = Tuple[Callable[[Any], Dict[str, Any]], Callable[[Dict[str, Any]], Any]]
+
+_codecs: Dict[type, MetadataCodec] = {}
+
+
+def get_metadata_codec(cls: type) -> MetadataCodec:
+    """
+    Get the (encode, decode) converters for a metadata dataclass.
+
+    encode(obj) returns a flat ChromaDB metadata dictionary. decode(data)
+    rebuilds the dataclass and accepts both native values and the
+    string-encoded ints/bools written by older indexes.
+
+    Args:
+        cls: Dataclass whose fields are scalars or JSON-serializable lists
+
+    Returns:
+        Tuple of (encode, decode) functions, cached per class
+    """
+    codec = _codecs.get(cls)
+    if codec is None:
+        codec = _build_codec(cls)
+        _codecs[cls] = codec
+    return codec
+
+
+def _build_codec(cls: type) -> MetadataCodec:
+    """Generate the encode/decode functions for a dataclass."""
+    hints = typing.get_type_hints(cls)
+    encode_items = []
+    decode_items = []
+
+    for field in dataclasses.fields(cls):
+        name = field.name
+        field_type = hints[name]
+
+        if field_type is bool:
+            encode_items.append(f"{name!r}: obj.{name}")
+            decode_items.append(f"{name}=data[{name!r}] in _true")
+        elif field_type in (int, float):
+            encode_items.append(f"{name!r}: obj.{name}")
+            decode_items.append(f"{name}={field_type.__name__}(data[{name!r}])")
+        elif field_type in _NATIVE_TYPES:
+            encode_items.append(f"{name!r}: obj.{name}")
+            decode_items.append(f"{name}=data[{name!r}]")
+        else:
+            encode_items.append(f"{name!r}: _dumps(obj.{name})")
+            decode_items.append(f"{name}=_loads(data.get({name!r}, '[]'))")
+
+    source = (
+        "def encode(obj):\n"
+        f"    return {{{', '.join(encode_items)}}}\n"
+        "\n"
+        "def decode(data):\n"
+        f"    return _cls({', '.join(decode_items)})\n"
+    )
+
+    namespace = {
+        "_cls": cls,
+        "_true": _TRUE_VALUES,
+        "_dumps": dumps_json,
+        "_loads": loads_json,
+    }
+    exec(compile(source, f"<metadata codec {cls.__name__}>", "exec"), namespace)
+    return namespace["encode"], namespace["decode"]
@@ -0,0 +1,474 @@
+"""
+In-process cache for vector store query results.
+
+Repeated RAG lookups with the same query embedding (or text), top_k and
+filters are served from memory instead of going through ChromaDB's
+HNSW + sqlite query path.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import simsimd
+except ImportError:  # Optional speedup (pip install falconeye[speedups])
+    simsimd = None
+
+
+def canonicalize_filters(filters: Optional[dict]) -> Tuple[Optional[dict], str]:
+    """
+    Canonicalize metadata filters for querying and cache keys.
+
+    Args:
+        filters: Metadata filters (may be None or empty)
+
+    Returns:
+        Tuple of (filters with keys sorted recursively, sha1 hex digest);
+        (None, "") when there are no filters
+    """
+    if not filters:
+        return None, ""
+
+    encoded = json.dumps(filters, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return json.loads(encoded), hashlib.sha1(encoded).hexdigest()
+
+
+class QueryCache:
+    """
+    LRU cache with TTL for vector search results.
+
+    Entries are keyed by collection, top_k, filters and a digest of the
+    query embedding. Results are stored already converted to domain
+    objects so a hit skips both the query and the result conversion.
+
+    Thread-safe: searches may run on executor threads.
+
+    Example:
+        >>> cache = QueryCache(max_size=256, ttl_seconds=300.0)
+        >>> key = cache.make_key("falconeye_code", 5, None, embedding=[0.1, 0.2])
+        >>> cache.get(key) is None
+        True
+    """
+
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 300.0):
+        """
+        Initialize query cache.
+
+        Args:
+            max_size: Maximum number of cached queries
+            ttl_seconds: Seconds before a cached result expires
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[Tuple, Tuple[float, List[Any]]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(
+        collection: str,
+        top_k: int,
+        filters: Optional[dict],
+        embedding: Optional[Sequence[float]] = None,
+        query: Optional[str] = None,
+        filters_digest: Optional[str] = None,
+    ) -> Tuple:
+        """
+        Build a cache key for a search.
+
+        Args:
+            collection: Full ChromaDB collection name
+            top_k: Number of requested results
+            filters: Metadata filters (order of keys does not matter)
+            embedding: Query embedding, if searching by vector
+            query: Query text, if searching by text
+            filters_digest: Digest from canonicalize_filters(), used instead
+                of re-encoding filters when the caller already has it
+
+        Returns:
+            Hashable cache key
+        """
+        if embedding is not None:
+            payload = np.asarray(embedding, dtype=np.float32).tobytes()
+            query_digest = "e:" + hashlib.sha1(payload).hexdigest()
+        else:
+            query_digest = "t:" + hashlib.sha1((query or "").encode("utf-8")).hexdigest()
+
+        if filters_digest is None:
+            _, filters_digest = canonicalize_filters(filters)
+
+        return (collection, top_k, filters_digest, query_digest)
+
+    def get(self, key: Tuple) -> Optional[List[Any]]:
+        """
+        Get cached results for a key.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Copy of the cached result list, or None on miss/expiry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            stored_at, results = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return list(results)
+
+    def put(self, key: Tuple, results: List[Any]) -> None:
+        """
+        Store results for a key, evicting the least recently used entry.
+
+        Args:
+            key: Cache key from make_key()
+            results: Search results to cache
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), list(results))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, collection: Optional[str] = None) -> None:
+        """
+        Drop cached results.
+
+        Args:
+            collection: Only drop entries for this collection (all if None)
+        """
+        with self._lock:
+            if collection is None:
+                self._entries.clear()
+                return
+
+            stale_keys = [key for key in self._entries if key[0] == collection]
+            for key in stale_keys:
+                del self._entries[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, hits, misses and evictions
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+
+class SemanticQueryCache:
+    """
+    Approximate cache for near-duplicate query embeddings.
+
+    Uses random-projection LSH: each normalized query embedding is hashed
+    to the sign bits of its projection onto num_bits random hyperplanes.
+    A lookup compares the query against entries in its own bucket and the
+    buckets one bit away, and returns a cached result when the cosine
+    similarity reaches the bucket's threshold.
+
+    Thresholds adapt per bucket: when a near miss turns out to produce the
+    same results as its neighbour the bucket threshold is relaxed, and when
+    a close neighbour produced different results it is tightened.
+
+    Cached vectors are stored quantized (int8 with the norm of the quantized
+    vector by default), which cuts cache memory to a quarter of float32 and
+    keeps cosine error around 1e-3, well below typical thresholds.
+
+    Thread-safe: searches may run on executor threads.
+    """
+
+    PRECISIONS = ("int8", "float16", "float32")
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        num_bits: int = 16,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300.0,
+        min_threshold: float = 0.85,
+        seed: int = 0,
+        precision: str = "int8",
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            threshold: Initial cosine similarity required for a hit
+            num_bits: Number of hyperplanes (hash bits, at most 64)
+            max_entries: Maximum number of cached queries
+            ttl_seconds: Seconds before a cached result expires
+            min_threshold: Lower bound for adaptive bucket thresholds
+            seed: Seed for the random projection matrix
+            precision: Storage type for cached vectors: "int8", "float16"
+                or "float32"
+        """
+        if not 1 <= num_bits <= 64:
+            raise ValueError("num_bits must be between 1 and 64")
+        if precision not in self.PRECISIONS:
+            raise ValueError(
+                f"Invalid precision '{precision}', must be one of {list(self.PRECISIONS)}"
+            )
+
+        self.threshold = threshold
+        self.num_bits = num_bits
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.min_threshold = min(min_threshold, threshold)
+        self.seed = seed
+        self.precision = precision
+
+        # Created lazily once the embedding dimension is known
+        self._planes: Optional[np.ndarray] = None
+
+        # (namespace, hash) -> {entry_id: (stored_at, (vector, inv_norm), signature, results)}
+        self._buckets: Dict[Tuple, Dict[int, Tuple[float, Tuple[np.ndarray, float], Tuple, List[Any]]]] = {}
+        self._bucket_thresholds: Dict[Tuple, float] = {}
+        self._order: "OrderedDict[int, Tuple]" = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.RLock()
+
+        self._hits = 0
+        self._misses = 0
+
+    def _normalize(self, embedding: Sequence[float]) -> Optional[np.ndarray]:
+        """Return the L2-normalized float32 vector, or None for a zero vector."""
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def _encode(self, vector: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Encode a normalized vector in the storage precision.
+
+        Returns:
+            Tuple of (stored vector, reciprocal of the stored vector's norm)
+        """
+        if self.precision == "int8":
+            scale = float(np.abs(vector).max()) / 127.0
+            quantized = np.round(vector / scale).astype(np.int8)
+            norm = float(np.linalg.norm(quantized.astype(np.float32)))
+            return quantized, 1.0 / norm
+        if self.precision == "float16":
+            stored = vector.astype(np.float16)
+            return stored, 1.0 / float(np.linalg.norm(stored.astype(np.float32)))
+        return vector, 1.0
+
+    def _hash(self, vector: np.ndarray) -> int:
+        """Hash a normalized vector to its packed LSH sign bits."""
+        if self._planes is None or self._planes.shape[1] != vector.shape[0]:
+            rng = np.random.default_rng(self.seed)
+            self._planes = rng.standard_normal(
+                (self.num_bits, vector.shape[0])
+            ).astype(np.float32)
+            # A dimension change invalidates every existing hash
+            self._buckets.clear()
+            self._bucket_thresholds.clear()
+            self._order.clear()
+
+        bits = (self._planes @ vector) > 0
+        return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+    def _neighbour_hashes(self, hash_value: int) -> List[int]:
+        """Return the hash itself followed by every hash one bit away."""
+        total_bits = ((self.num_bits + 7) // 8) * 8
+        shift = total_bits - self.num_bits
+        return [hash_value] + [
+            hash_value ^ (1 << (bit + shift)) for bit in range(self.num_bits)
+        ]
+
+    def _best_match(
+        self,
+        namespace: Tuple,
+        encoded: Tuple[np.ndarray, float],
+        hash_value: int,
+    ) -> Tuple[Optional[Tuple], float, Optional[Tuple]]:
+        """
+        Find the most similar live entry in the neighbouring buckets.
+
+        Returns:
+            Tuple of (bucket key, similarity, entry) for the best candidate
+        """
+        now = time.monotonic()
+        candidates = []
+        for neighbour in self._neighbour_hashes(hash_value):
+            bucket_key = (namespace, neighbour)
+            bucket = self._buckets.get(bucket_key)
+            if not bucket:
+                continue
+            for entry in bucket.values():
+                if now - entry[0] <= self.ttl_seconds:
+                    candidates.append((bucket_key, entry))
+
+        if not candidates:
+            return None, -1.0, None
+
+        vector, inv_norm = encoded
+        if simsimd is not None:
+            # SIMD cosine kernels work on the stored int8/float16 vectors
+            # directly, without widening copies
+            matrix = np.stack([entry[1][0] for _, entry in candidates])
+            distances = simsimd.cdist(vector[np.newaxis, :], matrix, metric="cosine")
+            similarities = 1.0 - np.asarray(distances, dtype=np.float32)[0]
+        else:
+            # int8 dot products are accumulated in int32 to avoid overflow
+            acc_dtype = np.int32 if self.precision == "int8" else np.float32
+            matrix = np.stack([entry[1][0] for _, entry in candidates]).astype(acc_dtype)
+            inv_norms = np.array([entry[1][1] for _, entry in candidates], dtype=np.float32)
+            similarities = (matrix @ vector.astype(acc_dtype)) * inv_norms * inv_norm
+        best = int(np.argmax(similarities))
+        bucket_key, entry = candidates[best]
+        return bucket_key, float(similarities[best]), entry
+
+    def get(
+        self,
+        namespace: Tuple,
+        embedding: Sequence[float],
+    ) -> Optional[List[Any]]:
+        """
+        Look up results for a query embedding similar to a cached one.
+
+        Args:
+            namespace: Search parameters that must match exactly
+                (collection, top_k, filters)
+            embedding: Query embedding
+
+        Returns:
+            Copy of the cached result list, or None on miss
+        """
+        vector = self._normalize(embedding)
+        if vector is None:
+            return None
+
+        with self._lock:
+            hash_value = self._hash(vector)
+            bucket_key, similarity, entry = self._best_match(
+                namespace, self._encode(vector), hash_value
+            )
+
+            threshold = self._bucket_thresholds.get((namespace, hash_value), self.threshold)
+            if entry is not None and similarity >= threshold:
+                self._hits += 1
+                return list(entry[3])
+
+            self._misses += 1
+            return None
+
+    def put(
+        self,
+        namespace: Tuple,
+        embedding: Sequence[float],
+        results: List[Any],
+        signature: Tuple,
+    ) -> None:
+        """
+        Store results for a query embedding.
+
+        Args:
+            namespace: Search parameters (collection, top_k, filters)
+            embedding: Query embedding
+            results: Search results to cache
+            signature: Hashable identity of the results, used to adapt
+                bucket thresholds (e.g. tuple of file path/chunk index)
+        """
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        with self._lock:
+            hash_value = self._hash(vector)
+            own_key = (namespace, hash_value)
+            encoded = self._encode(vector)
+
+            # Adapt the threshold using the nearest neighbour that was rejected
+            _, similarity, nearest = self._best_match(namespace, encoded, hash_value)
+            if nearest is not None:
+                threshold = self._bucket_thresholds.get(own_key, self.threshold)
+                if nearest[2] == signature and similarity < threshold:
+                    self._bucket_thresholds[own_key] = max(
+                        self.min_threshold, (threshold + similarity) / 2
+                    )
+                elif nearest[2] != signature and similarity >= self.min_threshold:
+                    self._bucket_thresholds[own_key] = min(
+                        0.999, max(threshold, (similarity + 1.0) / 2)
+                    )
+
+            entry_id = self._next_id
+            self._next_id += 1
+            self._buckets.setdefault(own_key, {})[entry_id] = (
+                time.monotonic(), encoded, signature, list(results)
+            )
+            self._order[entry_id] = own_key
+
+            while len(self._order) > self.max_entries:
+                old_id, old_key = self._order.popitem(last=False)
+                bucket = self._buckets.get(old_key)
+                if bucket is not None:
+                    bucket.pop(old_id, None)
+                    if not bucket:
+                        del self._buckets[old_key]
+
+    def invalidate(self, collection: Optional[str] = None) -> None:
+        """
+        Drop cached results.
+
+        Args:
+            collection: Only drop entries whose namespace starts with this
+                collection (all if None)
+        """
+        with self._lock:
+            if collection is None:
+                self._buckets.clear()
+                self._bucket_thresholds.clear()
+                self._order.clear()
+                return
+
+            stale_keys = [key for key in self._buckets if key[0][0] == collection]
+            for key in stale_keys:
+                for entry_id in self._buckets.pop(key):
+                    self._order.pop(entry_id, None)
+                self._bucket_thresholds.pop(key, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, buckets, hits and misses
+        """
+        with self._lock:
+            return {
+                "size": len(self._order),
+                "buckets": len(self._buckets),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
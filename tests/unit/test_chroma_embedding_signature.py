@@ -0,0 +1,87 @@
+"""Tests for the embedding signature check of the ChromaDB adapter."""
+
+import pytest
+
+chromadb = pytest.importorskip("chromadb")
+
+from falconeye.domain.exceptions import EmbeddingMismatchError
+from falconeye.infrastructure.vector_stores.chroma_adapter import ChromaVectorStoreAdapter
+
+SIGNATURE = "ollama/api/embed:embeddinggemma:300m:native"
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Persistent ChromaDB client in a temporary directory."""
+    return chromadb.PersistentClient(path=str(tmp_path))
+
+
+def make_adapter(client, tmp_path, signature=SIGNATURE):
+    """Build an adapter sharing the test client."""
+    return ChromaVectorStoreAdapter(
+        persist_directory=str(tmp_path),
+        embedding_signature=signature,
+        client=client,
+    )
+
+
+def add_legacy_collection(client, metadata=None):
+    """Create a code collection the way older versions did, with one record."""
+    coll = client.get_or_create_collection(
+        name="falconeye_code",
+        metadata=metadata or {"description": "FalconEYE code collection"},
+    )
+    coll.add(
+        ids=["legacy"],
+        embeddings=[[0.5, 0.5, 0.5]],
+        documents=["print('legacy')"],
+        metadatas=[{"file_path": "legacy.py"}],
+    )
+    return coll
+
+
+@pytest.mark.unit
+async def test_legacy_collection_is_rebuilt_with_signature(client, tmp_path):
+    add_legacy_collection(client)
+    adapter = make_adapter(client, tmp_path)
+
+    assert await adapter.ensure_embedding_compatibility("code") is True
+
+    coll = client.get_collection(name="falconeye_code")
+    assert coll.metadata["embedding_signature"] == SIGNATURE
+    assert coll.count() == 0
+    assert await adapter.ensure_embedding_compatibility("code") is False
+
+
+@pytest.mark.unit
+async def test_legacy_collection_fails_searches(client, tmp_path):
+    add_legacy_collection(client)
+    adapter = make_adapter(client, tmp_path)
+
+    with pytest.raises(EmbeddingMismatchError, match="--force-reindex"):
+        await adapter.check_embedding_compatibility("code")
+    with pytest.raises(EmbeddingMismatchError):
+        await adapter.search_by_embedding([0.5, 0.5, 0.5], collection="code")
+
+
+@pytest.mark.unit
+async def test_mismatched_collection_needs_rebuild(client, tmp_path):
+    add_legacy_collection(client, {"embedding_signature": "ollama/api/embed:other:native"})
+    other = client.get_or_create_collection(name="falconeye_documents")
+    adapter = make_adapter(client, tmp_path)
+
+    with pytest.raises(EmbeddingMismatchError, match="falconeye_code"):
+        await adapter.ensure_embedding_compatibility("code")
+
+    assert await adapter.ensure_embedding_compatibility("code", rebuild=True) is True
+    assert client.get_collection(name="falconeye_code").count() == 0
+    # Only the affected collection is dropped
+    assert client.get_collection(name="falconeye_documents").id == other.id
+
+
+@pytest.mark.unit
+async def test_missing_collection_is_compatible(client, tmp_path):
+    adapter = make_adapter(client, tmp_path)
+
+    await adapter.check_embedding_compatibility("code")
+    assert await adapter.ensure_embedding_compatibility("code") is False